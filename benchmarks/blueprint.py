@@ -0,0 +1,62 @@
+"""
+Compares Form instantiation time with and without blueprint.
+
+    PYTHONPATH=. python benchmarks/blueprint.py
+"""
+from timeit import timeit
+
+from formskit.converters import ToInt
+from formskit.field import AvalibleValue
+from formskit.tree_form import TreeForm
+from formskit.validators import NotEmpty, IsDigit, IsValueInAvalibleValues
+
+FIELDS = 50
+OPTIONS = 100
+NUMBER = 1000
+
+
+class RowForm(TreeForm):
+
+    def create_form(self):
+        for index in range(FIELDS // 5):
+            self.add_field('row%d' % index, validators=[NotEmpty()])
+
+
+class MainForm(TreeForm):
+
+    row_form = RowForm
+
+    def create_form(self):
+        for index in range(FIELDS):
+            field = self.add_field(
+                'field%d' % index,
+                label='Field number %d' % index,
+                validators=[NotEmpty(), IsDigit(), IsValueInAvalibleValues()],
+                convert=ToInt())
+            field.set_avalible_values([
+                AvalibleValue(value, 'Option %d' % value)
+                for value in range(OPTIONS)
+            ])
+        self.add_sub_form(self.row_form())
+
+
+class BlueprintRowForm(RowForm):
+    use_blueprint = True
+
+
+class BlueprintMainForm(MainForm):
+    use_blueprint = True
+    row_form = BlueprintRowForm
+
+
+def main():
+    plain = timeit(MainForm, number=NUMBER)
+    blueprint = timeit(BlueprintMainForm, number=NUMBER)
+    print('fields: %d, options: %d, instances: %d' % (
+        FIELDS, OPTIONS, NUMBER))
+    print('create_form: %.3fs' % plain)
+    print('blueprint:   %.3fs (%.2fx)' % (blueprint, plain / blueprint))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Measures memory used by submitted field values.
+
+    PYTHONPATH=. python benchmarks/memory.py
+"""
+import tracemalloc
+
+from formskit.form import Form
+
+VALUES = 50000
+
+
+def measure(values):
+    form = Form()
+    field = form.add_field('tags')
+    tracemalloc.start()
+    field.set_values(values)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    values = ['tag%d' % index for index in range(VALUES)]
+    size = measure(values)
+    print('values: %d' % VALUES)
+    print('total: %d bytes' % size)
+    print('per value: %.1f bytes' % (size / VALUES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares parsing TreeForm raw data key by key and grouped by sub form, for
+different depth and breadth of the tree.
+
+    PYTHONPATH=. python benchmarks/parse.py
+"""
+from timeit import timeit
+
+from formskit.form import Form
+from formskit.tree_form import TreeForm
+
+FIELDS = 10
+SHAPES = [(1, 100), (2, 30), (3, 10), (4, 5)]
+NUMBER = 20
+
+
+def make_form(depth):
+    form = TreeForm()
+    for index in range(FIELDS):
+        form.add_field('field%d' % index)
+    if depth > 0:
+        form.add_sub_form(make_form(depth - 1))
+    return form
+
+
+def make_raw_data(form, depth, breadth, raw_data):
+    for field in form.fields.values():
+        raw_data[field.get_name()] = ['value']
+    if depth > 0:
+        for index in range(breadth):
+            sub_form = form.get_or_create_sub_form('TreeForm', index)
+            make_raw_data(sub_form, depth - 1, breadth, raw_data)
+    return raw_data
+
+
+def parse_per_key(form, raw_data):
+    Form._parse_raw_data(form, raw_data)
+    form.reset()
+
+
+def parse_grouped(form, raw_data):
+    form._parse_raw_data(raw_data)
+    form.reset()
+
+
+def main():
+    for depth, breadth in SHAPES:
+        form = make_form(depth)
+        raw_data = make_raw_data(form, depth, breadth, {})
+        form.reset()
+        per_key = timeit(lambda: parse_per_key(form, raw_data), number=NUMBER)
+        grouped = timeit(lambda: parse_grouped(form, raw_data), number=NUMBER)
+        print('depth: %d  breadth: %3d  keys: %5d  per key: %.3fs  '
+              'grouped: %.3fs' % (
+                  depth, breadth, len(raw_data), per_key, grouped))
+
+
+if __name__ == '__main__':
+    main()
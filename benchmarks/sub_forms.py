@@ -0,0 +1,67 @@
+"""
+Compares making TreeForm sub forms with copy.deepcopy and with cloning from
+the schema, for growing number of rows. deepcopy also copies the parent form
+with all rows made before, so it is measured only for small row counts.
+
+    PYTHONPATH=. python benchmarks/sub_forms.py
+"""
+from copy import deepcopy
+from timeit import timeit
+
+from formskit.converters import ToInt
+from formskit.tree_form import TreeForm
+from formskit.validators import NotEmpty, IsDigit, IsDecimal
+
+ROWS = [10, 50, 100, 1000, 2000]
+DEEPCOPY_ROWS = 50
+NUMBER = 3
+
+
+class LineForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('product', validators=[NotEmpty()])
+        self.add_field(
+            'quantity', validators=[NotEmpty(), IsDigit()], convert=ToInt())
+        self.add_field('price', validators=[NotEmpty(), IsDecimal()])
+        self.add_field('description')
+
+
+class InvoiceForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('number', validators=[NotEmpty()])
+        self.add_sub_form(LineForm())
+
+
+class DeepcopyInvoiceForm(InvoiceForm):
+
+    def _clone_sub_form(self, name):
+        form = deepcopy(self.childs[name][0])
+        form.reset()
+        return form
+
+
+def make_rows(form, rows):
+    for index in range(rows):
+        form.get_or_create_sub_form('LineForm', index)
+    form.reset()
+
+
+def main():
+    deepcopy_form = DeepcopyInvoiceForm()
+    schema_form = InvoiceForm()
+    for rows in ROWS:
+        if rows <= DEEPCOPY_ROWS:
+            old = '%.3fs' % timeit(
+                lambda: make_rows(deepcopy_form, rows), number=NUMBER)
+        else:
+            old = '-'
+        new = timeit(lambda: make_rows(InvoiceForm(), rows), number=NUMBER)
+        reused = timeit(lambda: make_rows(schema_form, rows), number=NUMBER)
+        print('rows: %5d  deepcopy: %7s  schema: %.3fs  reused: %.3fs' % (
+            rows, old, new, reused))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+from inspect import isawaitable
+
+
+async def maybe_await(result):
+    """
+    Await the result if it is awaitable (validator method was a coroutine),
+    or return it as it is (validator method was a normal one).
+    """
+    if isawaitable(result):
+        return await result
+    return result
+
+
+def not_awaitable(result, obj, method):
+    """
+    Return the result of validator method, or raise TypeError if it is
+    awaitable, because coroutine validators are not awaited by ``validate``.
+    """
+    if isawaitable(result):
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+        raise TypeError(
+            '%s.%s is a coroutine, use validate_async instead of validate.'
+            % (obj.__class__.__name__, method))
+    return result
+
+
+def is_overridden(obj, cls, name):
+    """
+    Check if method ``name`` of obj was overridden in a subclass of cls.
+    """
+    return getattr(type(obj), name) is not getattr(cls, name)
@@ -0,0 +1,76 @@
+from copy import copy
+from types import MethodType
+
+
+def fast_copy(obj):
+    """
+    Make shallow copy of object, without the ``copy.copy`` protocol overhead.
+    """
+    try:
+        state = obj.__dict__
+    except AttributeError:
+        return copy(obj)
+    new = obj.__class__.__new__(obj.__class__)
+    new.__dict__.update(state)
+    return new
+
+
+def rebind(value, old, new):
+    """
+    If value is a method bound to ``old``, return the same method bound to
+    ``new``. Other values are returned as they are.
+    """
+    if isinstance(value, MethodType) and value.__self__ is old:
+        return MethodType(value.__func__, new)
+    return value
+
+
+class FormBlueprint(object):
+
+    """
+    Remembers what ``create_form`` made for a form class, so next instances
+    can be made by copying fields, validators and sub forms instead of running
+    ``create_form`` again.
+    """
+
+    _blueprints = {}
+
+    def __init__(self, form_class):
+        self.form_class = form_class
+        self.prototype = form_class.__new__(form_class)
+        self.prototype._init_before_create()
+        self.prototype.create_form()
+
+    @classmethod
+    def get(cls, form_class):
+        """
+        Get blueprint for form class. It will be made at first call.
+
+        :param form_class: subclass of Form
+        """
+        try:
+            return cls._blueprints[form_class]
+        except KeyError:
+            blueprint = cls(form_class)
+            cls._blueprints[form_class] = blueprint
+            return blueprint
+
+    @classmethod
+    def clear(cls, form_class=None):
+        """
+        Forget blueprints, so ``create_form`` will be called again.
+
+        :param form_class: forget only this class (default: all)
+        """
+        if form_class is None:
+            cls._blueprints.clear()
+        else:
+            cls._blueprints.pop(form_class, None)
+
+    def stamp(self, form):
+        """
+        Copy fields, validators and sub forms from prototype to the form.
+
+        :param form: form after ``_init_before_create``
+        """
+        form._copy_schema(self.prototype)
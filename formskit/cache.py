@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LRUCache(object):
+
+    """
+    Bounded, thread safe cache, which removes the least recently used items
+    when ``max_size`` is reached.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def __deepcopy__(self, memo):
+        # Shared between forms, so copied forms use the same one.
+        return self
+
+    def get(self, key, default=None):
+        """
+        Get item from cache.
+
+        :param key: key of the item
+        :param default: what to return if item is not found
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Put item into cache.
+
+        :param key: key of the item
+        :param value: value of the item
+        """
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove item from cache, if it is there.
+
+        :param key: key of the item
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        """Remove all items and reset counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+class TTLCache(LRUCache):
+
+    """
+    LRUCache, which also forgets items older than ``ttl`` seconds.
+    """
+
+    def __init__(self, max_size=1000, ttl=60, clock=monotonic):
+        super().__init__(max_size)
+        self.ttl = ttl
+        self.clock = clock
+
+    def get(self, key, default=None):
+        """
+        Get item from cache. Expired items are removed and not returned.
+
+        :param key: key of the item
+        :param default: what to return if item is not found
+        """
+        with self._lock:
+            try:
+                expires, value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires <= self.clock():
+                del self._items[key]
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Put item into cache.
+
+        :param key: key of the item
+        :param value: value of the item
+        :param ttl: how many seconds the item is valid (default: ``ttl`` of
+            the cache)
+        """
+        if ttl is None:
+            ttl = self.ttl
+        super().set(key, (self.clock() + ttl, value))
@@ -14,3 +14,22 @@ class ValueNotPresent(Exception):
 
     def __str__(self):
         return self.name
+
+
+class NotPicklable(Exception):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+class LimitExceeded(Exception):
+
+    def __init__(self, name, limit):
+        self.name = name
+        self.limit = limit
+
+    def __str__(self):
+        return '%s (%s)' % (self.name, self.limit)
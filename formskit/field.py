@@ -1,8 +1,8 @@
-from json import dumps
-from base64 import urlsafe_b64encode
+from time import perf_counter
 
+from .blueprint import fast_copy, rebind
 from .converters import FakeConvert
-from .translation import Translable
+from .translation import LazyTranslation, Translable, TranslableBase
 
 
 class Field(Translable):
@@ -12,32 +12,102 @@ class Field(Translable):
                  validators=None,
                  label=None,
                  ignore=False,
-                 convert=None):
+                 convert=None,
+                 fail_fast=False):
         self.name = name
         self.label = label
         self.ignore = ignore
+        self.fail_fast = fail_fast
         self.form = None
         self._init_validators(validators)
         self._init_convert(convert)
         self.values = []
         self.reset(True)
         self._avalible_values = None
-
-    def set_avalible_values(self, avalible_values):
+        self._avalible_index = None
+        self._avalible_ttl = None
+        self._avalible_cache_key = None
+
+    def set_avalible_values(self, avalible_values, ttl=None, cache_key=None):
+        """set_avalible_values(avalible_values[, ttl, cache_key])
+        Set values which are avalible for this field.
+
+        :param avalible_values: list of AvalibleValue or callable which
+            returns them
+        :param ttl: if set and avalible_values is callable, values are kept
+            for ttl seconds in ``avalible_values_cache`` of the form, which is
+            shared by all instances of the form class
+        :param cache_key: callable, which gets the form and returns part of the
+            cache key (for example language of the form)
+        """
         self._avalible_values = avalible_values
+        self._avalible_index = None
+        self._avalible_ttl = ttl
+        self._avalible_cache_key = cache_key
 
     @property
     def avalible_values(self):
         if self._avalible_values is None:
             return []
+        if self._is_avalible_values_static():
+            return self._avalible_values
+        if self._is_avalible_values_cached():
+            return self._get_cached_avalible_values()[0]
+        return self._avalible_values()
+
+    def _is_avalible_values_static(self):
+        return (
+            self._avalible_values is None
+            or hasattr(self._avalible_values, '__contains__'))
+
+    def _is_avalible_values_cached(self):
+        return self._avalible_ttl is not None and self.form is not None
+
+    def get_avalible_index(self):
+        """
+        Get AvalibleIndex of values from ``avalible_values``. For lists it is
+        made only once, until ``set_avalible_values`` is called again. For
+        cached callables it is kept in the cache with the values. For other
+        callables it is made every time, as the values can change.
+        """
+        if self._is_avalible_values_static():
+            if self._avalible_index is None:
+                self._avalible_index = AvalibleIndex(self.avalible_values)
+            return self._avalible_index
+        if self._is_avalible_values_cached():
+            return self._get_cached_avalible_values()[1]
+        return AvalibleIndex(self.avalible_values)
+
+    def _get_cached_avalible_values(self):
+        cache = self.form.avalible_values_cache
+        key = self._get_avalible_cache_key()
+        item = cache.get(key)
+        if item is None:
+            values = list(self._avalible_values())
+            item = (values, AvalibleIndex(values))
+            cache.set(key, item, self._avalible_ttl)
+        return item
+
+    def _get_avalible_cache_key(self):
+        key = self._avalible_cache_key
         return (
-            self._avalible_values
-            if hasattr(self._avalible_values, '__contains__')
-            else self._avalible_values()
+            self.form.__class__,
+            self.name,
+            None if key is None else key(self.form),
         )
 
+    def invalidate_avalible_values(self):
+        """
+        Remove cached avalible values of this field, so the next use will call
+        the callable again.
+        """
+        if self._is_avalible_values_cached():
+            self.form.avalible_values_cache.delete(
+                self._get_avalible_cache_key())
+
     def _init_validators(self, validators=None):
         self.validators = []
+        self._regex_engine = None
         validators = validators or []
         for validator in validators:
             validator.init_field(self)
@@ -48,6 +118,32 @@ class Field(Translable):
         Set form parent.
         """
         self.form = form
+        self._reset_name()
+
+    def _reset_name(self):
+        pass
+
+    def clone(self):
+        """
+        Make a fresh copy of this field, without the form and values.
+        Validators and converter are copied, so the new field can be validated
+        independently from this one.
+        """
+        field = fast_copy(self)
+        field.form = None
+        field._init_validators(
+            [fast_copy(validator) for validator in self.validators])
+        field._init_convert(fast_copy(self.convert))
+        field.values = []
+        field.reset(True)
+        return field
+
+    def _rebind(self, old_form, new_form):
+        # Avalible values providers can be methods of the form.
+        self._avalible_values = rebind(
+            self._avalible_values, old_form, new_form)
+        self._avalible_cache_key = rebind(
+            self._avalible_cache_key, old_form, new_form)
 
     def _init_convert(self, convert):
         if convert is None:
@@ -73,19 +169,166 @@ class Field(Translable):
 
         :return: Is validation successed?
         """
-        for validator in self.validators:
-            validator.make_field()
+        validators = self._get_validators()
+        measures = self._get_measures()
+
+        for validator in validators:
+            self._make(measures, validator, validator.make_field)
+            if self._is_chain_stopped(validator):
+                break
 
         self.convert.make_field()
 
-        if self.error:
-            return False
+        if not self.error:
+            for validator in validators:
+                self._make(
+                    measures, validator, validator.make_values, self.values)
+                if self._is_chain_stopped(validator):
+                    break
+
+        self._save_measures(measures)
+        return not self.error
+
+    async def validate_async(self):
+        """
+        Validate field. Validators can have coroutine ``validate_field`` and
+        ``validate_value`` methods.
+
+        :return: Is validation successed?
+        """
+        validators = self._get_validators()
+        measures = self._get_measures()
+
+        for validator in validators:
+            await self._make_async(
+                measures, validator, validator.make_field_async)
+            if self._is_chain_stopped(validator):
+                break
+
+        self.convert.make_field()
 
-        for validator in self.validators:
-            for value in self.values:
-                validator.make_value(value)
+        if not self.error:
+            for validator in validators:
+                await self._make_async(
+                    measures,
+                    validator,
+                    validator.make_values_async,
+                    self.values)
+                if self._is_chain_stopped(validator):
+                    break
+
+        self._save_measures(measures)
         return not self.error
 
+    def _make(self, measures, validator, method, *args):
+        validator._rejected = False
+        if measures is None:
+            method(*args)
+            return
+        start = perf_counter()
+        method(*args)
+        self._add_measure(measures, validator, perf_counter() - start)
+
+    async def _make_async(self, measures, validator, method, *args):
+        validator._rejected = False
+        if measures is None:
+            await method(*args)
+            return
+        start = perf_counter()
+        await method(*args)
+        self._add_measure(measures, validator, perf_counter() - start)
+
+    def _add_measure(self, measures, validator, time):
+        # Both steps (field and values) are counted as one validation.
+        old_time, rejected = measures.get(validator, (0.0, False))
+        measures[validator] = (
+            old_time + time, rejected or validator._rejected)
+
+    def _get_measures(self):
+        if self.form is None:
+            return None
+        root = self.form._get_root()
+        if root.collect_validator_stats or root.reorder_validators:
+            return {}
+        return None
+
+    def _save_measures(self, measures):
+        if not measures:
+            return
+        registry = self.form.validator_stats
+        for position, validator in enumerate(self.validators):
+            try:
+                time, rejected = measures[validator]
+            except KeyError:
+                continue
+            registry.add(
+                self._get_stats_key(position, validator), time, rejected)
+
+    def _get_stats_key(self, position, validator):
+        return (self.form.__class__, self.name, position, validator.__class__)
+
+    def _get_validators(self):
+        if self.form is None or not self.form._get_root().reorder_validators:
+            return self.validators
+        return self.get_validators_plan()
+
+    def get_validators_plan(self):
+        """
+        Get validators in the order based on the collected stats: cheap
+        validators which often fail are first. Validators with ``pinned`` set
+        to True, or not validated enough times yet, stay at their position.
+        """
+        if self.form is None:
+            return list(self.validators)
+        registry = self.form.validator_stats
+        positions = []
+        scores = []
+        for position, validator in enumerate(self.validators):
+            if validator.pinned:
+                continue
+            stats = registry.find(self._get_stats_key(position, validator))
+            if stats is None or stats.calls < registry.min_calls:
+                continue
+            positions.append(position)
+            scores.append((stats.get_score(), position))
+        plan = list(self.validators)
+        for position, (score, old_position) in zip(positions, sorted(scores)):
+            plan[position] = self.validators[old_position]
+        return plan
+
+    def explain_validators(self):
+        """
+        Get validators in the order they are run, with collected stats.
+
+        :rtype: list of dicts
+        """
+        plan = self._get_validators()
+        registry = None if self.form is None else self.form.validator_stats
+        explain = []
+        for validator in plan:
+            position = self.validators.index(validator)
+            stats = None
+            if registry is not None:
+                stats = registry.find(self._get_stats_key(position, validator))
+            explain.append({
+                'validator': validator.__class__.__name__,
+                'position': position,
+                'pinned': validator.pinned,
+                'calls': stats.calls if stats else 0,
+                'rejections': stats.rejections if stats else 0,
+                'rejection_rate': stats.rejection_rate if stats else None,
+                'cost': stats.cost if stats else None,
+            })
+        return explain
+
+    def _is_chain_stopped(self, validator):
+        # Rest of validators is skipped after an error, when the field is set
+        # to stop on the first error, or when this validator failed and is
+        # set to stop on its error.
+        if validator.stop_on_error and validator._rejected:
+            return True
+        return self.error and self.fail_fast
+
     def set_error(self, text):
         """
         Sets error for field.
@@ -93,9 +336,22 @@ class Field(Translable):
         :param text: text of error
         """
         self.error = True
-        message = self._get_message_object()
-        message.init(text, field=self)
-        self.messages.append(message)
+        self._set_dirty()
+        self.messages.append(LazyTranslation(self, text, field=self))
+
+    def _set_dirty(self):
+        if self.form is not None:
+            self.form._set_field_dirty(self)
+
+    def _set_changed(self):
+        if self.form is not None:
+            self.form._set_changed()
+
+    def _reset_errors(self):
+        Translable.reset(self)
+        self.error = False
+        for field_value in self.values:
+            field_value.reset()
 
     def get_value(self, index=0, default=NotImplemented):
         """
@@ -160,14 +416,24 @@ class Field(Translable):
         """
         if not self._can_this_be_edited(force):
             return
-        self.values = []
-        for value in values:
-            self.values.append(
-                FieldValue(
-                    self,
-                    value
-                )
-            )
+        self._set_dirty()
+        values = [FieldValue(self, value) for value in values]
+        # Values which did not change are kept with their validation results.
+        if self._are_values_changed(values):
+            self.values = values
+            self._set_changed()
+
+    def _are_values_changed(self, values):
+        if len(values) != len(self.values):
+            return True
+        for old_value, field_value in zip(self.values, values):
+            if not self._is_same_value(old_value.value, field_value.value):
+                return True
+        return False
+
+    def _is_same_value(self, old, new):
+        # 1, 1.0 and True are equal, but they are not the same value.
+        return type(old) is type(new) and old == new
 
     def set_value(self, value, index=0, force=False):
         """
@@ -179,15 +445,17 @@ class Field(Translable):
         """
         if not self._can_this_be_edited(force):
             return
+        self._set_dirty()
+        value = self.convert.back(value)
         try:
             field_value = self.values[index]
-            field_value.value = self.convert.back(value)
         except IndexError:
-            self.values.append(
-                FieldValue(
-                    self,
-                    self.convert.back(value)
-                ))
+            self.values.append(FieldValue(self, value))
+            self._set_changed()
+            return
+        if not self._is_same_value(field_value.value, value):
+            field_value.value = value
+            self._set_changed()
 
     def get_name(self):
         """
@@ -203,23 +471,53 @@ class TreeField(Field):
 
     def get_name(self):
         """
-        Get name of field.
+        Get name of field. Name is computed once and kept until the form is
+        moved to other parent or index.
         """
-        data = {
-            'name': self.name,
-            'parents': self.form._get_parents(),
-        }
-        json = dumps(data)
-        return urlsafe_b64encode(json.encode())
+        if self._name is None:
+            self._name = self._encode_name(self.form._get_parents())
+        return self._name
+
+    def _get_name(self, parents):
+        if self._name is None:
+            self._name = self._encode_name(parents)
+        return self._name
+
+    def _reset_name(self):
+        self._name = None
+
+    def _encode_name(self, parents):
+        return self.form.name_codec.encode(self.name, parents)
+
 
+class FieldValue(TranslableBase):
 
-class FieldValue(Translable):
+    __slots__ = ('field', 'value', 'error', '_messages')
 
     def __init__(self, field, value):
         self.field = field
         self.value = value
         self.reset()
 
+    @property
+    def messages(self):
+        """
+        List of error messages. The list is made only when it is needed.
+        """
+        if self._messages is None:
+            self._messages = []
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages):
+        self._messages = messages
+
+    def get_error_messages(self):
+        """
+        Get all error messages.
+        """
+        return [message() for message in self._messages or ()]
+
     def set_error(self, text):
         """
         Set error for field value.
@@ -228,12 +526,12 @@ class FieldValue(Translable):
         """
         self.error = True
         self.field.error = True
-        message = self.field._get_message_object()
-        message.init(text, field=self.field, value=self)
-        self.messages.append(message)
+        self.field._set_dirty()
+        self.messages.append(LazyTranslation(
+            self.field, text, field=self.field, value=self))
 
     def reset(self):
-        super().reset()
+        self._messages = None
         self.error = False
 
 
@@ -242,3 +540,35 @@ class AvalibleValue(object):
     def __init__(self, value, label=None):
         self.value = value
         self.label = label
+
+
+class AvalibleIndex(object):
+
+    """
+    Set of values of AvalibleValue objects, for fast checking if value is
+    avalible. Values which can not be hashed are kept in a list.
+    """
+
+    __slots__ = ('_hashed', '_unhashable')
+
+    def __init__(self, avalible_values):
+        hashed = set()
+        unhashable = []
+        for avalible in avalible_values:
+            try:
+                hashed.add(avalible.value)
+            except TypeError:
+                unhashable.append(avalible.value)
+        self._hashed = frozenset(hashed)
+        self._unhashable = unhashable
+
+    def __contains__(self, value):
+        try:
+            if value in self._hashed:
+                return True
+        except TypeError:
+            pass
+        return value in self._unhashable
+
+    def __len__(self):
+        return len(self._hashed) + len(self._unhashable)
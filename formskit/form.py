@@ -1,12 +1,30 @@
+from asyncio import gather
+from threading import Lock
+
+from .blueprint import FormBlueprint, fast_copy, rebind
+from .cache import TTLCache
+from .errors import LimitExceeded
 from .field import Field
 from .formvalidators import FormValidationError
-from .translation import Translation, Translable
+from .stats import StatsRegistry
+from .translation import LazyTranslation, Translation, Translable
+
+# Sub forms can be validated in many threads (validation_executor).
+_errors_lock = Lock()
 
 
 class Form(Translable):
 
     form_name_value = 'form_name'
     translation_class = Translation
+    use_blueprint = False
+    max_values_per_field = None
+    max_value_bytes = None
+    max_errors = None
+    collect_validator_stats = False
+    reorder_validators = False
+    avalible_values_cache = TTLCache(1000)
+    validator_stats = StatsRegistry()
 
     def get_name(self):
         """Gets name of this form."""
@@ -14,15 +32,36 @@ class Form(Translable):
 
     def __init__(self):
         self._init_before_create()
-        self.create_form()
+        if self.use_blueprint:
+            FormBlueprint.get(self.__class__).stamp(self)
+        else:
+            self.create_form()
         self.reset()
 
     def _init_before_create(self):
         self.fields = {}
         self.form_validators = []
+        self._dirty_fields = set()
+        self._changed = True
+        self._errors_count = 0
+        self._parsed_bytes = 0
         self.raw_data = None
         self.index = None
 
+    def _copy_schema(self, prototype):
+        # Attributes set in create_form are copied (shallow), methods bound to
+        # the prototype are bound to this form. Attributes made by
+        # _init_before_create are already here and are not copied.
+        for name, value in prototype.__dict__.items():
+            if name not in self.__dict__:
+                self.__dict__[name] = rebind(value, prototype, self)
+        for field in prototype.fields.values():
+            field = field.clone()
+            field._rebind(prototype, self)
+            self.add_field_object(field)
+        for validator in prototype.form_validators:
+            self.add_form_validator(fast_copy(validator))
+
     def add_field_object(self, field):
         """
         Add field to form.
@@ -31,6 +70,13 @@ class Form(Translable):
         """
         self.fields[field.name] = field
         field.init_form(self)
+        self._set_field_dirty(field)
+
+    def _set_field_dirty(self, field):
+        self._dirty_fields.add(field)
+
+    def _set_changed(self):
+        self._changed = True
 
     def add_field(self, *args, **kwargs):
         """
@@ -52,7 +98,38 @@ class Form(Translable):
         """
         if self._is_form_submitted(raw_data):
             self._parse_raw_data(raw_data)
-            if self._validate():
+            return self._run_validation()
+        else:
+            return None
+
+    def validate_dict(self, data):
+        """
+        Parse data with ``parse_dict`` and validate this object. Unlike
+        ``validate``, data uses names of fields (and lists of dicts for sub
+        forms), so no form name is needed.
+
+        :returns: True if validation is success, False if it fails
+        """
+        self.parse_dict(data)
+        return self._run_validation()
+
+    def _run_validation(self):
+        if self._validate():
+            self.on_success()
+            return True
+        else:
+            self.on_fail()
+            return False
+
+    async def validate_async(self, raw_data):
+        """
+        Same as ``validate``, but validators can have coroutine methods
+        (``validate_value``, ``validate_field`` and
+        ``FormValidator.validate``). Fields are validated concurrently.
+        """
+        if self._is_form_submitted(raw_data):
+            self._parse_raw_data(raw_data)
+            if await self._validate_async():
                 self.on_success()
                 return True
             else:
@@ -61,10 +138,27 @@ class Form(Translable):
         else:
             return None
 
+    def validate_many(self, iterable):
+        """
+        Validate many raw data dicts one after another, using this form
+        instance. Form is cleared before every item, so memory usage does not
+        depend on the length of the iterable.
+
+        :param iterable: iterable of raw data dicts
+        :returns: generator of ``(success, data, report)`` tuples, where
+            ``success`` is the same as result of ``validate``, ``data`` is
+            result of ``get_data_dict`` and ``report`` of ``get_report``
+        """
+        for raw_data in iterable:
+            self.clear()
+            success = self.validate(raw_data)
+            yield success, self.get_data_dict(), self.get_report()
+
     def _is_form_submitted(self, raw_data):
         return raw_data.get(self.form_name_value, None) == [self.get_name(), ]
 
     def _parse_raw_data(self, raw_data):
+        self._check_raw_data(raw_data)
         self.raw_data = raw_data
         for name, values in raw_data.items():
             if name == self.form_name_value:
@@ -72,6 +166,29 @@ class Form(Translable):
             field = self._get_field(name)
             field.set_values(values)
 
+    def _check_raw_data(self, raw_data):
+        # Limits are checked for the whole data, before anything is parsed.
+        root = self._get_root()
+        max_bytes = root.max_value_bytes
+        size = 0
+        for name, values in raw_data.items():
+            self._check_values_count(values)
+            if max_bytes is None:
+                continue
+            for value in values:
+                if isinstance(value, (str, bytes)):
+                    size += len(value)
+            if size > max_bytes:
+                raise LimitExceeded('max_value_bytes', max_bytes)
+
+    def _check_values_count(self, values):
+        limit = self._get_root().max_values_per_field
+        if limit is not None and len(values) > limit:
+            raise LimitExceeded('max_values_per_field', limit)
+
+    def _get_root(self):
+        return self
+
     def _get_field(self, name):
         try:
             return self.fields[name]
@@ -79,17 +196,38 @@ class Form(Translable):
             raise WrongValueName(name)
 
     def reset(self):
-        """Reset the form and clear all it's fields."""
+        """
+        Reset the form and clear all it's fields. Only fields which were
+        changed since the last reset are cleared.
+        """
         super().reset()
         self.success = None
-        for field in self.fields.values():
+        self._changed = True
+        self._errors_count = 0
+        dirty_fields = self._dirty_fields
+        self._dirty_fields = set()
+        for field in dirty_fields:
             field.reset()
+            if field.ignore:
+                self._dirty_fields.add(field)
+
+    def clear(self):
+        """
+        Reset the form, its raw data and also fields with ``ignore`` set to
+        True, so nothing is left from the previous use.
+        """
+        self.reset()
+        self.raw_data = None
+        for field in self._dirty_fields:
+            field.reset(True)
+        self._dirty_fields = set()
 
     def _validate(self):
         # Why this method was implemented in this way?
         # Goal was to run validation on fields and if it succeeded, then form
         # can run form validators.
         # But sub_forms should always run validation.
+        self._start_validation()
         self.success = True
         self.success &= (
             self._validate_fields()
@@ -97,23 +235,84 @@ class Form(Translable):
         )
         return self.success
 
+    async def _validate_async(self):
+        self._start_validation()
+        self.success = True
+        self.success &= (
+            await self._validate_fields_async()
+            and await self._validate_form_validators_async()
+        )
+        return self.success
+
+    def _reset_errors(self):
+        Translable.reset(self)
+        for field in self.fields.values():
+            field._reset_errors()
+
+    def _start_validation(self):
+        # Error budget is counted for one validation of the root form.
+        if self._get_root() is self:
+            self._errors_count = 0
+
     def _validate_fields(self):
+        # Fields which were not validated because of the error budget can not
+        # be reported as a success.
         success = True
         for field in self.fields.values():
-            success &= field.validate()
+            if self._is_error_budget_spent():
+                return False
+            if not field.validate():
+                success = False
+                self._count_error()
         return success
 
+    async def _validate_fields_async(self):
+        if self._get_root().max_errors is not None:
+            # Budget needs the fields to be validated one after another.
+            success = True
+            for field in self.fields.values():
+                if self._is_error_budget_spent():
+                    return False
+                if not await field.validate_async():
+                    success = False
+                    self._count_error()
+            return success
+        results = await gather(
+            *[field.validate_async() for field in self.fields.values()])
+        return all(results)
+
+    def _count_error(self):
+        with _errors_lock:
+            self._get_root()._errors_count += 1
+
+    def _is_error_budget_spent(self):
+        root = self._get_root()
+        return (
+            root.max_errors is not None
+            and root._errors_count >= root.max_errors)
+
     def _validate_form_validators(self):
         for validator in self.form_validators:
             try:
                 validator()
             except FormValidationError as er:
-                message = self._get_message_object()
-                message.init(er.message, form=self)
-                self.messages.append(message)
+                self._set_form_validator_error(er)
+                return False
+        return True
+
+    async def _validate_form_validators_async(self):
+        for validator in self.form_validators:
+            try:
+                await validator.call_async()
+            except FormValidationError as er:
+                self._set_form_validator_error(er)
                 return False
         return True
 
+    def _set_form_validator_error(self, er):
+        self.messages.append(LazyTranslation(self, er.message, form=self))
+        self._count_error()
+
     def add_form_validator(self, validator):
         """
         Adds form validator to form.
@@ -182,6 +381,43 @@ class Form(Translable):
                 del tree[name]
         return tree
 
+    def explain_validators(self):
+        """
+        Get validators of all fields in the order they are run, with stats
+        collected when ``collect_validator_stats`` or ``reorder_validators``
+        is set.
+
+        :rtype: dict
+        """
+        return {
+            'fields': {
+                name: field.explain_validators()
+                for name, field in self.fields.items()
+            },
+        }
+
+    def iter_data(self, minified=False):
+        """iter_data([minified])
+        Iterate over values of all fields. Values are converted only when the
+        field is reached, so the whole data is never kept in memory.
+
+        :param minified: if True: all list with length of 1 will be converted
+            to direct value. all empty list will be omited
+        :returns: generator of ``(path, name, values)`` tuples, where path is
+            a tuple of ``(form name, index)`` pairs of sub forms (empty for
+            fields of this form)
+        """
+        return self._iter_data((), minified)
+
+    def _iter_data(self, path, minified):
+        for name, field in self.fields.items():
+            values = field.get_values()
+            if minified and len(values) == 1:
+                values = values[0]
+            elif minified and len(values) == 0:
+                continue
+            yield path, name, values
+
     def parse_dict(self, data, force=False):
         """parse_dict(data[, force])
         Parse data from dict. Keys is the field name, values can be in form of
@@ -193,6 +429,9 @@ class Form(Translable):
         """
         def raise_error(name):
             raise KeyError(name)
+        if self._get_root() is self:
+            # max_value_bytes counts values of the whole data, with sub forms.
+            self._parsed_bytes = 0
         for name, values in data.items():
             (
                 self._parsed_field(name, values, force)
@@ -203,17 +442,36 @@ class Form(Translable):
     def _parsed_sub_form(self, name, values):
         return False
 
+    def _is_known_name(self, name):
+        return name in self.fields
+
     def _parsed_field(self, name, values, force=False):
         if name in self.fields:
             field = self.fields[name]
             if hasattr(values, '__iter__') and type(values) is not str:
+                if not hasattr(values, '__len__'):
+                    values = list(values)
+                self._check_values_count(values)
+                self._check_parsed_bytes(values)
                 field.set_values(values, force=force)
             else:
+                self._check_parsed_bytes([values])
                 field.set_value(values, force=force)
             return True
         else:
             return False
 
+    def _check_parsed_bytes(self, values):
+        root = self._get_root()
+        max_bytes = root.max_value_bytes
+        if max_bytes is None:
+            return
+        for value in values:
+            if isinstance(value, (str, bytes)):
+                root._parsed_bytes += len(value)
+        if root._parsed_bytes > max_bytes:
+            raise LimitExceeded('max_value_bytes', max_bytes)
+
     def get_report(self):
         """Get report from all fields."""
         def convert(messages):
@@ -233,7 +491,7 @@ class Form(Translable):
                 values.append({
                     'value': value.value,
                     'success': not value.error,
-                    'messages': convert(value.messages),
+                    'messages': value.get_error_messages(),
                 })
             report['fields'][name] = {
                 'success': not field.error,
@@ -1,4 +1,7 @@
 # encoding: utf8
+from .asyncs import is_overridden, maybe_await, not_awaitable
+
+
 class FormValidationError(Exception):
 
     def __init__(self, validator):
@@ -14,7 +17,18 @@ class FormValidator(object):
         self.form = form
 
     def __call__(self):
-        if not self.validate():
+        if not not_awaitable(self.validate(), self, 'validate'):
+            raise FormValidationError(self)
+
+    async def call_async(self):
+        """
+        Same as calling validator, but ``validate`` can be a coroutine. If
+        ``__call__`` was overridden, it is used instead.
+        """
+        if is_overridden(self, FormValidator, '__call__'):
+            self()
+            return
+        if not await maybe_await(self.validate()):
             raise FormValidationError(self)
 
 
@@ -0,0 +1,134 @@
+from csv import DictReader
+from itertools import islice
+from json import loads
+
+from .errors import LimitExceeded
+from .form import WrongValueName
+
+
+class FormImporter(object):
+
+    """
+    Validates rows read from CSV or JSON Lines files with a form. Files are
+    read incrementally and results are returned in chunks, so the next rows
+    are read only when the previous chunk was consumed.
+    """
+
+    def __init__(self, form, columns=None, chunk_size=1000, minified=False):
+        """
+        :param form: form instance used to validate every row
+        :param columns: dict of column name to field name (default: columns
+            are named like fields). Columns which do not match any field or
+            sub form are skipped.
+        :param chunk_size: number of rows in one chunk
+        :param minified: passed to ``get_data_dict`` for valid rows
+        """
+        self.form = form
+        self.columns = columns or {}
+        self.chunk_size = chunk_size
+        self.minified = minified
+
+    def import_csv(self, path, encoding='utf8', **kwargs):
+        """
+        Validate rows of CSV file. First line must be the header.
+
+        :param path: path to the file
+        :param encoding: encoding of the file
+        :param kwargs: passed to ``csv.DictReader``
+        :returns: generator of ``(valid, errors)`` chunks
+        """
+        with open(path, newline='', encoding=encoding) as file:
+            reader = DictReader(file, **kwargs)
+            rows = ((reader.line_num, row) for row in reader)
+            yield from self.import_rows(rows)
+
+    def import_jsonl(self, path, encoding='utf8'):
+        """
+        Validate JSON Lines file. Every not empty line must be a JSON object.
+
+        :param path: path to the file
+        :param encoding: encoding of the file
+        :returns: generator of ``(valid, errors)`` chunks
+        """
+        with open(path, encoding=encoding) as file:
+            rows = (
+                (number, line)
+                for number, line in enumerate(file, 1)
+                if line.strip()
+            )
+            yield from self.import_rows(rows, loads)
+
+    def import_rows(self, rows, decode=None):
+        """
+        Validate rows.
+
+        :param rows: iterable of ``(line, row)`` tuples, where row is a dict
+        :param decode: function called on row before validation
+        :returns: generator of ``(valid, errors)`` chunks. ``valid`` is a list
+            of ``(line, data)`` and ``errors`` is a list of
+            ``(line, row, report)``.
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            valid = []
+            errors = []
+            for line, row in chunk:
+                self._import_row(line, row, decode, valid, errors)
+            yield valid, errors
+
+    def _import_row(self, line, row, decode, valid, errors):
+        # Errors of one row (bad format, unknown names, limits) are reported
+        # as errors of this row, so the rest of the file is still imported.
+        self.form.clear()
+        try:
+            data = row if decode is None else decode(row)
+            success = self.form.validate_dict(self._map_row(data))
+        except (ValueError, KeyError, LimitExceeded, WrongValueName) as error:
+            errors.append((line, row, self._get_decode_report(error)))
+            return
+        if success:
+            valid.append((line, self.form.get_data_dict(self.minified)))
+        else:
+            errors.append((line, row, self.form.get_report()))
+
+    def _map_row(self, row):
+        if not isinstance(row, dict):
+            raise ValueError('Row is not an object: %r' % (row,))
+        data = {}
+        for column, values in row.items():
+            name = self.columns.get(column, column)
+            if name in self.form.fields:
+                if not isinstance(values, list):
+                    values = [values]
+                data[name] = values
+            elif self.form._is_known_name(name):
+                self._check_sub_form_rows(self.form, name, values)
+                data[name] = values
+        return data
+
+    def _check_sub_form_rows(self, form, name, rows):
+        # Sub form values must be a list of objects, also in nested sub forms.
+        if not isinstance(rows, list):
+            raise ValueError('Sub form %s is not a list: %r' % (name, rows))
+        sub_form = form.childs[name][0]
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError(
+                    'Row of sub form %s is not an object: %r' % (name, row))
+            for child_name, values in row.items():
+                if child_name in sub_form.childs:
+                    self._check_sub_form_rows(sub_form, child_name, values)
+
+    def _get_decode_report(self, error):
+        message = str(error)
+        if not isinstance(error, ValueError):
+            message = '%s: %s' % (
+                error.__class__.__name__, getattr(error, 'name', message))
+        return {
+            'success': False,
+            'messages': [message],
+            'fields': {},
+        }
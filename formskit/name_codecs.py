@@ -0,0 +1,98 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from json import dumps, loads
+
+
+class NameCodec(object):
+
+    """
+    Encodes address of a TreeField (name of the field and list of parent
+    forms) into a single name and decodes it back.
+    """
+
+    def encode(self, name, parents):
+        """
+        Encode address of field.
+
+        :param name: name of the field
+        :param parents: list of ``{'name': ..., 'index': ...}`` dicts, starting
+            from the root form
+
+        It should be reimplemented.
+        """
+        pass
+
+    def decode(self, raw):
+        """
+        Decode name made by ``encode``. Should raise ValueError, KeyError or
+        TypeError when the name is malformed.
+
+        :param raw: encoded name
+        :returns: tuple of field name and tuple of ``(form name, index)``
+            pairs, without the root form
+
+        It should be reimplemented.
+        """
+        pass
+
+
+class JsonNameCodec(NameCodec):
+
+    """
+    Default codec. Name is a base64 encoded json, for example:
+    ``{"name": "name", "parents": [{"name": "Form", "index": null}]}``.
+    """
+
+    def encode(self, name, parents):
+        data = {
+            'name': name,
+            'parents': parents,
+        }
+        json = dumps(data)
+        return urlsafe_b64encode(json.encode())
+
+    def decode(self, raw):
+        json = urlsafe_b64decode(raw).decode('utf8')
+        data = loads(json)
+        if not data['parents']:
+            raise ValueError(raw)
+        parents = tuple(
+            (parent['name'], parent['index'])
+            for parent in data['parents'][1:]
+        )
+        return data['name'], parents
+
+
+class PathNameCodec(NameCodec):
+
+    """
+    Compact codec. Name is a path of sub form names and indexes, separated by
+    dots, for example: ``PeopleForm.3.name``. Root form is omitted, so names of
+    fields and forms can not contain dots.
+    """
+
+    separator = '.'
+
+    def encode(self, name, parents):
+        parts = []
+        for parent in parents[1:]:
+            parts.append(parent['name'])
+            parts.append(str(parent['index']))
+        parts.append(name)
+        for part in parts:
+            if self.separator in part:
+                raise ValueError(
+                    'Name %r can not contain %r' % (part, self.separator))
+        return self.separator.join(parts)
+
+    def decode(self, raw):
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf8')
+        parts = raw.split(self.separator)
+        if len(parts) % 2 == 0:
+            raise ValueError(raw)
+        parents = []
+        for index in range(0, len(parts) - 1, 2):
+            if not parts[index + 1].isdigit():
+                raise ValueError(raw)
+            parents.append((parts[index], int(parts[index + 1])))
+        return parts[-1], tuple(parents)
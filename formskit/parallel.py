@@ -0,0 +1,112 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from itertools import islice
+from os import cpu_count
+from pickle import dumps, PicklingError
+
+from .errors import NotPicklable
+
+_forms = {}
+
+
+def validate_parallel(
+    form_class,
+    iterable,
+    workers=None,
+    chunk_size=100,
+    ordered=True,
+):
+    """
+    Validate raw data dicts in many processes. Every worker makes its own
+    instance of the form class and runs ``validate_many`` on chunks of data,
+    so validators and converters are never sent between processes. Only
+    ``workers * 2`` chunks are waiting at once, so the iterable is read
+    lazily.
+
+    :param form_class: subclass of Form, which can be imported by workers
+    :param iterable: iterable of raw data dicts
+    :param workers: number of processes (default: number of CPUs)
+    :param chunk_size: number of raw data dicts sent to worker at once
+    :param ordered: if False, results are returned when ready, not in the
+        order of the iterable
+    :returns: generator of ``(index, success, data, report)`` tuples, where
+        ``index`` is position of raw data in the iterable
+    """
+    # Checked here, so the error is raised at the call, not at first next().
+    _check_picklable(form_class)
+    return _validate_parallel(
+        form_class, iterable, workers, chunk_size, ordered)
+
+
+def _validate_parallel(form_class, iterable, workers, chunk_size, ordered):
+    workers = workers or cpu_count() or 1
+    chunks = _chunks(iterable, chunk_size)
+    with ProcessPoolExecutor(workers) as executor:
+        if ordered:
+            results = _run_ordered(executor, form_class, chunks, workers * 2)
+        else:
+            results = _run_unordered(
+                executor, form_class, chunks, workers * 2)
+        for result in results:
+            yield result
+
+
+def _check_picklable(form_class):
+    try:
+        dumps(form_class)
+    except (PicklingError, AttributeError, TypeError):
+        raise NotPicklable(
+            '%r can not be sent to worker processes. Define it at module '
+            'level, so it can be imported.' % (form_class,))
+
+
+def _chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _run_ordered(executor, form_class, chunks, window):
+    futures = deque()
+    for start, chunk in chunks:
+        futures.append(
+            executor.submit(_validate_chunk, form_class, start, chunk))
+        if len(futures) == window:
+            yield from futures.popleft().result()
+    while futures:
+        yield from futures.popleft().result()
+
+
+def _run_unordered(executor, form_class, chunks, window):
+    futures = set()
+    for start, chunk in chunks:
+        futures.add(
+            executor.submit(_validate_chunk, form_class, start, chunk))
+        if len(futures) == window:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    for future in as_completed(futures):
+        yield from future.result()
+
+
+def _validate_chunk(form_class, start, chunk):
+    try:
+        form = _forms[form_class]
+    except KeyError:
+        form = form_class()
+        _forms[form_class] = form
+    return [
+        (start + index, ) + result
+        for index, result in enumerate(form.validate_many(chunk))
+    ]
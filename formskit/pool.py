@@ -0,0 +1,87 @@
+from collections import deque
+from contextlib import contextmanager
+
+
+class FormPool(object):
+
+    """
+    Keeps cleared instances of one form class, so they can be used again
+    instead of making new ones. When the pool is full, the oldest instance is
+    evicted.
+    """
+
+    _pools = {}
+
+    def __init__(self, form_class, max_size=10):
+        self.form_class = form_class
+        self.max_size = max_size
+        self.forms = deque(maxlen=max_size)
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @classmethod
+    def get(cls, form_class, max_size=10):
+        """
+        Get pool for form class. It will be made at first call.
+
+        :param form_class: subclass of Form
+        :param max_size: how many instances pool can keep (used only when the
+            pool is made)
+        """
+        try:
+            return cls._pools[form_class]
+        except KeyError:
+            pool = cls(form_class, max_size)
+            cls._pools[form_class] = pool
+            return pool
+
+    def acquire(self):
+        """
+        Get clean form instance from the pool or make new one if pool is
+        empty.
+        """
+        try:
+            form = self.forms.pop()
+        except IndexError:
+            self.created += 1
+            return self.form_class()
+        self.reused += 1
+        return form
+
+    def release(self, form):
+        """
+        Clear the form and put it back to the pool. ValueError is raised if
+        the form is already in the pool.
+
+        :param form: form taken by ``acquire``
+        """
+        if type(form) is not self.form_class:
+            raise TypeError(
+                'Form %r does not belong to pool of %r' % (
+                    form, self.form_class))
+        if any(pooled is form for pooled in self.forms):
+            # Released twice, it would be acquired by two users.
+            raise ValueError('Form %r is already in the pool' % (form,))
+        form.clear()
+        if len(self.forms) == self.max_size:
+            self.evicted += 1
+        self.forms.append(form)
+
+    @contextmanager
+    def form(self):
+        """
+        Context manager which acquires form and releases it at the end.
+        """
+        form = self.acquire()
+        try:
+            yield form
+        finally:
+            self.release(form)
+
+    def clear(self):
+        """Remove all instances from the pool."""
+        self.forms.clear()
+
+    def __len__(self):
+        return len(self.forms)
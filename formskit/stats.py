@@ -0,0 +1,104 @@
+from threading import Lock
+
+
+class ValidatorStats(object):
+
+    """
+    Time and rejections of one validator of one field, counted for every
+    validation of the field.
+    """
+
+    __slots__ = ('calls', 'rejections', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.rejections = 0
+        self.time = 0.0
+
+    def add(self, time, rejected):
+        # Not thread safe, use StatsRegistry.add.
+        self.calls += 1
+        self.time += time
+        if rejected:
+            self.rejections += 1
+
+    @property
+    def cost(self):
+        """Average time of one validation in seconds."""
+        return self.time / self.calls if self.calls else None
+
+    @property
+    def rejection_rate(self):
+        """Part of validations which failed."""
+        return self.rejections / self.calls if self.calls else None
+
+    def get_score(self):
+        # Validators which reject more often for lower cost should be first.
+        # Validators which never reject are ordered only by cost, after
+        # all the others.
+        if self.rejections:
+            return (0, self.cost / self.rejection_rate)
+        return (1, self.cost)
+
+
+class StatsRegistry(object):
+
+    """
+    Thread safe registry of ValidatorStats. Stats are used for ordering only
+    when the validator was validated at least ``min_calls`` times.
+    """
+
+    def __init__(self, min_calls=10):
+        self.min_calls = min_calls
+        self._stats = {}
+        self._lock = Lock()
+
+    def __deepcopy__(self, memo):
+        # Shared between forms, so copied forms use the same one.
+        return self
+
+    def get(self, key):
+        """
+        Get stats for the key. New stats are made if not found.
+
+        :param key: key of the validator
+        """
+        with self._lock:
+            try:
+                return self._stats[key]
+            except KeyError:
+                stats = self._stats[key] = ValidatorStats()
+                return stats
+
+    def add(self, key, time, rejected):
+        """
+        Add one validation to the stats of the key. Stats of one validator can
+        be updated from many threads (``validation_executor``), so this is
+        done under the lock.
+
+        :param key: key of the validator
+        :param time: time of the validation in seconds
+        :param rejected: True if the validator failed
+        """
+        with self._lock:
+            try:
+                stats = self._stats[key]
+            except KeyError:
+                stats = self._stats[key] = ValidatorStats()
+            stats.add(time, rejected)
+
+    def find(self, key):
+        """
+        Get stats for the key, or None if not found.
+
+        :param key: key of the validator
+        """
+        return self._stats.get(key)
+
+    def clear(self):
+        """Remove all stats."""
+        with self._lock:
+            self._stats.clear()
+
+    def __len__(self):
+        return len(self._stats)
@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+from formskit.blueprint import FormBlueprint
+from formskit.converters import ToInt
+from formskit.form import Form
+from formskit.formvalidators import MustMatch
+from formskit.tree_form import TreeForm
+from formskit.validators import NotEmpty, IsDigit
+
+
+class ChildForm(TreeForm):
+
+    use_blueprint = True
+
+    def create_form(self):
+        self.add_field('surname', validators=[NotEmpty()])
+
+
+class ExampleForm(TreeForm):
+
+    use_blueprint = True
+    created = 0
+
+    def create_form(self):
+        ExampleForm.created += 1
+        self.add_field('name', validators=[NotEmpty(), IsDigit()])
+        self.add_field('age', convert=ToInt())
+        self.add_form_validator(MustMatch(['name', 'age']))
+        self.add_sub_form(ChildForm())
+
+
+class FlatForm(Form):
+
+    use_blueprint = True
+
+    def create_form(self):
+        self.add_field('name', validators=[NotEmpty()])
+
+
+class OptionsForm(Form):
+
+    use_blueprint = True
+
+    def create_form(self):
+        self.extra = 'extra'
+        self.add_field('option')
+        self.fields['option'].set_avalible_values(self.opts)
+
+    def opts(self):
+        return [self.extra]
+
+
+class FormBlueprintTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        FormBlueprint.clear()
+        ExampleForm.created = 0
+
+    def test_create_form_called_once(self):
+        ExampleForm()
+        ExampleForm()
+        ExampleForm()
+
+        assert ExampleForm.created == 1
+
+    def test_clear(self):
+        ExampleForm()
+        FormBlueprint.clear(ExampleForm)
+        ExampleForm()
+
+        assert ExampleForm.created == 2
+
+    def test_fields_are_not_shared(self):
+        first = ExampleForm()
+        second = ExampleForm()
+
+        first.set_value('name', '1')
+
+        assert first.fields['name'] is not second.fields['name']
+        assert first.fields['name'].form is first
+        assert second.get_values('name') == []
+
+    def test_validators_are_bound_to_new_field(self):
+        form = ExampleForm()
+
+        for validator in form.fields['name'].validators:
+            assert validator.field is form.fields['name']
+        assert form.fields['age'].convert.field is form.fields['age']
+        assert form.form_validators[0].form is form
+
+    def test_attributes_are_copied(self):
+        first = OptionsForm()
+        second = OptionsForm()
+        second.extra = 'second'
+
+        assert first.extra == 'extra'
+        assert first.fields['option'].avalible_values == ['extra']
+        assert second.fields['option'].avalible_values == ['second']
+
+    def test_sub_forms(self):
+        first = ExampleForm()
+        second = ExampleForm()
+
+        first_child = first.get_sub_form('ChildForm', 0)
+        second_child = second.get_sub_form('ChildForm', 0)
+
+        assert first_child is not second_child
+        assert first_child.parent is first
+        assert first_child.fields['surname'].form is first_child
+
+    def test_validate(self):
+        form = FlatForm()
+
+        assert form.validate({
+            form.form_name_value: [form.get_name()],
+            'name': ['one'],
+        }) is True
+
+        form = FlatForm()
+        assert form.validate({
+            form.form_name_value: [form.get_name()],
+        }) is False
+        assert form.get_report()['fields']['name']['messages'] == [
+            'NotEmpty']
@@ -0,0 +1,86 @@
+from formskit.cache import LRUCache, TTLCache
+from formskit.tests.base import FormskitTestCase
+
+
+class LRUCacheTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = LRUCache(2)
+
+    def test_get_missing(self):
+        assert self.cache.get('one') is None
+        assert self.cache.get('one', 'default') == 'default'
+        assert self.cache.misses == 2
+        assert self.cache.hits == 0
+
+    def test_get(self):
+        self.cache.set('one', 1)
+
+        assert self.cache.get('one') == 1
+        assert self.cache.hits == 1
+
+    def test_max_size(self):
+        self.cache.set('one', 1)
+        self.cache.set('two', 2)
+        self.cache.get('one')
+        self.cache.set('three', 3)
+
+        assert len(self.cache) == 2
+        assert self.cache.get('two') is None
+        assert self.cache.get('one') == 1
+        assert self.cache.get('three') == 3
+
+    def test_clear(self):
+        self.cache.set('one', 1)
+        self.cache.get('one')
+
+        self.cache.clear()
+
+        assert len(self.cache) == 0
+        assert self.cache.hits == 0
+        assert self.cache.misses == 0
+
+
+class TTLCacheTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.now = 100
+        self.cache = TTLCache(2, ttl=10, clock=lambda: self.now)
+
+    def test_get(self):
+        self.cache.set('one', 1)
+
+        assert self.cache.get('one') == 1
+        assert self.cache.hits == 1
+
+    def test_expired(self):
+        self.cache.set('one', 1)
+        self.now = 110
+
+        assert self.cache.get('one') is None
+        assert self.cache.misses == 1
+        assert len(self.cache) == 0
+
+    def test_ttl_of_item(self):
+        self.cache.set('one', 1, ttl=20)
+        self.now = 115
+
+        assert self.cache.get('one') == 1
+
+    def test_max_size(self):
+        self.cache.set('one', 1)
+        self.cache.set('two', 2)
+        self.cache.set('three', 3)
+
+        assert self.cache.get('one') is None
+        assert self.cache.get('three') == 3
+
+    def test_delete(self):
+        self.cache.set('one', 1)
+
+        self.cache.delete('one')
+        self.cache.delete('two')
+
+        assert self.cache.get('one') is None
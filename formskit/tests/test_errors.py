@@ -13,3 +13,9 @@ class ErrorsTests(FormskitTestCase):
         error = errors.ValueNotPresent('name2')
         self.assertEqual('name2', error.name)
         self.assertEqual('name2', str(error))
+
+    def test_LimitExceeded(self):
+        error = errors.LimitExceeded('max_depth', 3)
+        self.assertEqual('max_depth', error.name)
+        self.assertEqual(3, error.limit)
+        self.assertEqual('max_depth (3)', str(error))
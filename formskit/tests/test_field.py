@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from json import loads
 from base64 import urlsafe_b64decode
 from pytest import raises
@@ -5,10 +6,12 @@ from pytest import raises
 from formskit.tests.base import FormskitTestCase
 from formskit import Field
 from formskit.validators import NotEmpty, IsDigit
+from formskit.cache import TTLCache
+from formskit.stats import StatsRegistry
 from formskit.form import Form
 from formskit.tree_form import TreeForm
-from formskit.field import FieldValue
-from formskit.translation import Translation
+from formskit.field import AvalibleIndex, AvalibleValue, FieldValue
+from formskit.translation import LazyTranslation, Translation
 
 
 class ExampleField(Field):
@@ -62,6 +65,19 @@ class FieldTest(FormskitTestCase):
         field_value = field.values[0]
         assert 'value' == field_value.value
 
+    def test_set_equal_values_of_other_type(self):
+        field = ExampleField('name')
+        field.set_values([1])
+
+        field.set_values([True])
+
+        assert field.get_values() == [True]
+
+        field.set_value(1.0)
+
+        assert field.get_values() == [1.0]
+        assert type(field.get_value()) is float
+
     def test_set_values_on_ignore(self):
         field = ExampleField('name', ignore=True)
 
@@ -171,6 +187,64 @@ class TreeFieldTests(FormskitTestCase):
         }
 
 
+class TreeFieldNameCacheTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = TreeForm()
+        self.sub_form = TreeForm()
+        self.sub_form.add_field('name1')
+        self.form.add_sub_form(self.sub_form)
+
+    def _decode(self, raw):
+        return loads(urlsafe_b64decode(raw).decode())
+
+    def test_cached(self):
+        field = self.sub_form.fields['name1']
+        name = field.get_name()
+
+        field.name = 'changed'
+
+        assert field.get_name() is name
+
+    def test_reset_on_new_parent(self):
+        field = self.sub_form.fields['name1']
+        field.get_name()
+        parent = TreeForm()
+
+        parent.add_sub_form(self.form)
+
+        assert len(self._decode(field.get_name())['parents']) == 3
+
+    def test_reset_on_new_index(self):
+        field = self.sub_form.fields['name1']
+        field.get_name()
+
+        self.sub_form._set_parent(self.form, 4)
+
+        assert self._decode(field.get_name())['parents'][1]['index'] == 4
+
+    def test_get_field_names(self):
+        self.form.add_field('name2')
+        clone = self.form.get_or_create_sub_form('TreeForm', 1)
+
+        names = self.form.get_field_names()
+
+        assert names == {
+            'name2': self.form.fields['name2'].get_name(),
+            'TreeForm': {
+                0: {'name1': self.sub_form.fields['name1'].get_name()},
+                1: {'name1': clone.fields['name1'].get_name()},
+            },
+        }
+        assert self._decode(names['TreeForm'][1]['name1']) == {
+            'name': 'name1',
+            'parents': [
+                {'name': 'TreeForm', 'index': None},
+                {'name': 'TreeForm', 'index': 1}],
+        }
+
+
 class GetValueErrorTests(FormskitTestCase):
 
     def setUp(self):
@@ -189,3 +263,296 @@ class GetValueErrorTests(FormskitTestCase):
         self.field.values[0].messages = [(lambda: 'my error')]
 
         assert self.field.get_value_errors() == ['my error']
+
+
+class FieldValueTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.field = ExampleField('name')
+        self.field_value = FieldValue(self.field, 'val')
+
+    def test_no_dict(self):
+        assert not hasattr(self.field_value, '__dict__')
+
+    def test_messages_not_allocated(self):
+        assert self.field_value.get_error_messages() == []
+        assert self.field_value._messages is None
+
+    def test_messages_append(self):
+        self.field_value.messages.append(
+            LazyTranslation(self.field, 'msg', field=self.field))
+
+        assert self.field_value.get_error_messages() == ['msg']
+
+    def test_set_error(self):
+        self.field_value.set_error('msg')
+
+        assert self.field_value.error is True
+        assert self.field.error is True
+        assert self.field_value.messages[0].text == 'msg'
+
+    def test_reset(self):
+        self.field_value.set_error('msg')
+
+        self.field_value.reset()
+
+        assert self.field_value.error is False
+        assert self.field_value._messages is None
+
+
+class AvalibleIndexTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.field = ExampleField('name')
+
+    def test_contains(self):
+        index = AvalibleIndex(
+            [AvalibleValue('1'), AvalibleValue(['2']), AvalibleValue(3)])
+
+        assert '1' in index
+        assert ['2'] in index
+        assert 3 in index
+        assert '2' not in index
+        assert {} not in index
+        assert len(index) == 3
+
+    def test_index_is_kept(self):
+        self.field.set_avalible_values([AvalibleValue('1')])
+
+        index = self.field.get_avalible_index()
+
+        assert self.field.get_avalible_index() is index
+        assert '1' in index
+
+    def test_set_avalible_values_invalidates(self):
+        self.field.set_avalible_values([AvalibleValue('1')])
+        index = self.field.get_avalible_index()
+
+        self.field.set_avalible_values([AvalibleValue('2')])
+
+        assert self.field.get_avalible_index() is not index
+        assert '2' in self.field.get_avalible_index()
+        assert '1' not in self.field.get_avalible_index()
+
+    def test_callable_is_called_every_time(self):
+        values = [AvalibleValue('1')]
+        self.field.set_avalible_values(lambda: values)
+        assert '2' not in self.field.get_avalible_index()
+
+        values.append(AvalibleValue('2'))
+
+        assert '2' in self.field.get_avalible_index()
+
+    def test_no_avalible_values(self):
+        assert len(self.field.get_avalible_index()) == 0
+
+
+class CachedAvalibleValuesTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.now = 0
+        self.calls = []
+
+        class CachedForm(Form):
+            avalible_values_cache = TTLCache(10, clock=lambda: self.now)
+
+            def create_form(form):
+                field = form.add_field('name')
+                field.set_avalible_values(
+                    self.provider,
+                    ttl=60,
+                    cache_key=lambda form: form.language)
+                form.language = 'en'
+
+        self.form_class = CachedForm
+
+    def provider(self):
+        self.calls.append(self.now)
+        yield AvalibleValue(str(len(self.calls)))
+
+    def test_shared_by_instances(self):
+        first = self.form_class().fields['name']
+        second = self.form_class().fields['name']
+
+        assert [value.value for value in first.avalible_values] == ['1']
+        assert [value.value for value in second.avalible_values] == ['1']
+        assert '1' in second.get_avalible_index()
+        assert self.calls == [0]
+
+    def test_ttl(self):
+        field = self.form_class().fields['name']
+        field.get_avalible_index()
+        self.now = 60
+
+        assert '2' in field.get_avalible_index()
+        assert self.calls == [0, 60]
+
+    def test_cache_key(self):
+        form = self.form_class()
+        form.fields['name'].get_avalible_index()
+        other = self.form_class()
+        other.language = 'pl'
+
+        assert '2' in other.fields['name'].get_avalible_index()
+        assert '1' in form.fields['name'].get_avalible_index()
+
+    def test_invalidate(self):
+        field = self.form_class().fields['name']
+        field.get_avalible_index()
+
+        field.invalidate_avalible_values()
+
+        assert '2' in field.get_avalible_index()
+
+    def test_without_form(self):
+        field = ExampleField('name')
+        field.set_avalible_values(self.provider, ttl=60)
+
+        list(field.avalible_values)
+        list(field.avalible_values)
+
+        assert len(self.calls) == 2
+
+
+class FailFastTests(FormskitTestCase):
+
+    def _validate(self, field, values):
+        field.set_values(values)
+        field.validate()
+        return [value.error for value in field.values]
+
+    def test_exhaustive_by_default(self):
+        field = ExampleField('name', [NotEmpty(), IsDigit()])
+
+        assert self._validate(field, ['', 'a', 'b']) == [True, True, True]
+
+    def test_fail_fast_field(self):
+        field = ExampleField('name', [NotEmpty(), IsDigit()], fail_fast=True)
+
+        assert self._validate(field, ['1', '', 'a']) == [False, True, False]
+
+    def test_fail_fast_without_batch(self):
+        class Digit(IsDigit):
+
+            def validate_value(self):
+                return super().validate_value()
+
+        field = ExampleField('name', [Digit()], fail_fast=True)
+
+        assert self._validate(field, ['a', 'b']) == [True, False]
+
+    def test_stop_on_error(self):
+        not_empty = NotEmpty()
+        not_empty.stop_on_error = True
+        field = ExampleField('name', [not_empty, IsDigit()])
+
+        assert self._validate(field, ['', 'a']) == [True, False]
+        assert len(field.values[0].messages) == 1
+
+    def test_stop_on_error_of_field(self):
+        not_empty = NotEmpty()
+        not_empty.stop_on_error = True
+        validator = NotEmpty()
+        validator.validate_field = lambda: False
+        field = ExampleField('name', [not_empty, validator])
+
+        field.validate()
+
+        assert [message.text for message in field.messages] == ['NotEmpty']
+
+    def test_stop_on_error_after_other_error(self):
+        not_empty = NotEmpty()
+        not_empty.stop_on_error = True
+        field = ExampleField('name', [IsDigit(), not_empty, IsDigit()])
+
+        assert self._validate(field, ['a']) == [True]
+        assert len(field.values[0].messages) == 2
+
+
+class ValidatorStatsTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        class StatsForm(Form):
+            collect_validator_stats = True
+            validator_stats = StatsRegistry(min_calls=2)
+
+            def create_form(form):
+                form.add_field('name', validators=[IsDigit(), NotEmpty()])
+
+        self.form = StatsForm()
+        self.field = self.form.fields['name']
+
+    def _validate(self, *values):
+        for value in values:
+            self.form.reset()
+            self.field.set_values([value])
+            self.field.validate()
+
+    def _get_explain(self, key):
+        return [
+            validator[key] for validator in self.field.explain_validators()]
+
+    def test_collect(self):
+        self._validate('1', '', '2')
+
+        assert self._get_explain('validator') == ['IsDigit', 'NotEmpty']
+        assert self._get_explain('calls') == [3, 3]
+        assert self._get_explain('rejections') == [0, 1]
+        assert self._get_explain('rejection_rate') == [0, 1 / 3]
+        assert all(cost >= 0 for cost in self._get_explain('cost'))
+
+    def test_not_collected_by_default(self):
+        self.form.collect_validator_stats = False
+
+        self._validate('1')
+
+        assert self._get_explain('calls') == [0, 0]
+        assert len(self.form.validator_stats) == 0
+
+    def test_reorder(self):
+        self.form.reorder_validators = True
+        self._validate('', '')
+
+        assert self._get_explain('validator') == ['NotEmpty', 'IsDigit']
+        assert self._get_explain('position') == [1, 0]
+        assert self.field.validators[0].__class__ is IsDigit
+
+    def test_reorder_needs_min_calls(self):
+        self.form.reorder_validators = True
+        self._validate('')
+
+        assert self._get_explain('validator') == ['IsDigit', 'NotEmpty']
+
+    def test_pinned(self):
+        self.form.reorder_validators = True
+        self.field.validators[0].pinned = True
+        self._validate('', '')
+
+        assert self._get_explain('validator') == ['IsDigit', 'NotEmpty']
+        assert self._get_explain('pinned') == [True, False]
+
+    def test_add_from_threads(self):
+        registry = StatsRegistry()
+
+        def add():
+            for index in range(1000):
+                registry.add('key', 0.5, index % 2)
+
+        with ThreadPoolExecutor(4) as executor:
+            for future in [executor.submit(add) for index in range(4)]:
+                future.result()
+
+        stats = registry.find('key')
+        assert (stats.calls, stats.rejections, stats.time) == (
+            4000, 2000, 2000.0)
+
+    def test_form_explain(self):
+        explain = self.form.explain_validators()
+
+        assert list(explain) == ['fields']
+        assert explain['fields']['name'][0]['validator'] == 'IsDigit'
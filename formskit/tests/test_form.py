@@ -1,10 +1,12 @@
+from asyncio import run, sleep
 from mock import create_autospec
 from unittest import TestCase
 from pytest import raises
 
+from formskit.errors import LimitExceeded
 from formskit.field import Field
 from formskit.form import Form, WrongValueName
-from formskit.validators import NotEmpty, IsDigit
+from formskit.validators import FieldValidator, NotEmpty, IsDigit
 from formskit.converters import ToInt
 from formskit.formvalidators import FormValidator
 from formskit.translation import Translation
@@ -38,6 +40,40 @@ class FormTest(TestCase):
         assert form.success is None
         field.reset.assert_called_once_with()
 
+    def test_reset_only_dirty_fields(self):
+        form = Form()
+        form.add_field('one')
+        form.add_field('two', validators=[NotEmpty()])
+        form.add_field('three')
+        form.reset()
+
+        form.set_value('one', 'value')
+        form.fields['two'].validate()
+
+        assert form._dirty_fields == {form.fields['one'], form.fields['two']}
+
+        form.reset()
+
+        assert form._dirty_fields == set()
+        assert form.get_values('one') == []
+        assert form.fields['two'].error is False
+        assert form.fields['two'].messages == []
+
+    def test_reset_keeps_ignored_field_dirty(self):
+        form = Form()
+        field = form.add_field('one', ignore=True)
+        form.set_value('one', 'value', force=True)
+
+        form.reset()
+
+        assert form.get_values('one') == ['value']
+        assert form._dirty_fields == {field}
+
+        form.clear()
+
+        assert form.get_values('one') == []
+        assert form._dirty_fields == set()
+
     def test_is_validated(self):
         form = Form()
 
@@ -102,6 +138,296 @@ class FormTest(TestCase):
         assert form.fields['name'].messages[0]() == 'translated!'
 
 
+class LimitsTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = Form()
+        self.form.add_field('name')
+
+    def test_max_values_per_field(self):
+        self.form.max_values_per_field = 2
+
+        self.form._parse_raw_data({'name': ['1', '2']})
+        with raises(LimitExceeded) as error:
+            self.form._parse_raw_data({'name': ['1', '2', '3']})
+
+        assert error.value.name == 'max_values_per_field'
+        assert self.form.get_values('name') == ['1', '2']
+
+    def test_max_values_per_field_parse_dict(self):
+        self.form.max_values_per_field = 2
+
+        with raises(LimitExceeded):
+            self.form.parse_dict({'name': ['1', '2', '3']})
+
+    def test_max_value_bytes(self):
+        self.form.max_value_bytes = 5
+        self.form.add_field('second')
+
+        self.form._parse_raw_data({'name': ['12'], 'second': ['345']})
+        with raises(LimitExceeded) as error:
+            self.form._parse_raw_data({'name': ['12'], 'second': ['3456']})
+
+        assert error.value.name == 'max_value_bytes'
+        assert self.form.get_values('second') == ['345']
+
+    def test_max_value_bytes_validate_dict(self):
+        self.form.max_value_bytes = 5
+        self.form.add_field('second')
+
+        assert self.form.validate_dict({'name': '12', 'second': ['345']})
+        with raises(LimitExceeded) as error:
+            self.form.validate_dict({'name': ['12'], 'second': ['3456']})
+
+        assert error.value.name == 'max_value_bytes'
+
+
+class ValidateManyTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = Form()
+        self.form.add_field('name', validators=[NotEmpty()])
+        self.form.add_field('age', validators=[IsDigit()], convert=ToInt())
+
+    def _raw_data(self, **kwargs):
+        data = {self.form.form_name_value: [self.form.get_name()]}
+        data.update(kwargs)
+        return data
+
+    def test_results(self):
+        results = list(self.form.validate_many([
+            self._raw_data(name=['one'], age=['1']),
+            self._raw_data(age=['bad']),
+            {},
+        ]))
+
+        assert results[0][0] is True
+        assert results[0][1] == {'name': ['one'], 'age': [1]}
+        assert results[0][2]['success'] is True
+
+        assert results[1][0] is False
+        assert results[1][1] == {'name': [], 'age': [None]}
+        assert results[1][2]['fields']['name']['messages'] == ['NotEmpty']
+        assert results[1][2]['fields']['age']['values'][0]['messages'] == [
+            'IsDigit']
+
+        assert results[2][0] is None
+        assert results[2][1] == {'name': [], 'age': []}
+
+    def test_validate_dict(self):
+        assert self.form.validate_dict({'name': 'one', 'age': ['1']}) is True
+        assert self.form.get_data_dict() == {'name': ['one'], 'age': [1]}
+
+        self.form.reset()
+        assert self.form.validate_dict({'age': ['x']}) is False
+
+    def test_is_generator(self):
+        def items():
+            yield self._raw_data(name=['one'])
+            raise RuntimeError()
+
+        results = self.form.validate_many(items())
+
+        assert next(results)[0] is True
+        with raises(RuntimeError):
+            next(results)
+
+
+class AsyncNotEmpty(NotEmpty):
+
+    message = 'NotEmpty'
+
+    async def validate_value(self):
+        await sleep(0)
+        return super().validate_value()
+
+
+class AsyncHasValues(NotEmpty):
+
+    message = 'NotEmpty'
+
+    async def validate_field(self):
+        await sleep(0)
+        return len(self.field.values) > 0
+
+
+class AsyncMustMatch(FormValidator):
+
+    message = 'must match'
+
+    async def validate(self):
+        await sleep(0)
+        return self.form.get_value('name') == self.form.get_value('repeat')
+
+
+class ValidateAsyncTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = Form()
+        self.form.add_field('name', validators=[AsyncNotEmpty()])
+        self.form.add_field('repeat', validators=[AsyncHasValues()])
+        self.form.add_field('age', validators=[IsDigit()], convert=ToInt())
+        self.form.add_form_validator(AsyncMustMatch())
+
+    def _raw_data(self, **kwargs):
+        data = {self.form.form_name_value: [self.form.get_name()]}
+        data.update(kwargs)
+        return data
+
+    def test_success(self):
+        raw_data = self._raw_data(name=['one'], repeat=['one'], age=['1'])
+
+        assert run(self.form.validate_async(raw_data)) is True
+        assert self.form.get_data_dict() == {
+            'name': ['one'], 'repeat': ['one'], 'age': [1]}
+
+    def test_not_submitted(self):
+        assert run(self.form.validate_async({})) is None
+
+    def test_fields_fail(self):
+        raw_data = self._raw_data(name=[''], age=['bad'])
+
+        assert run(self.form.validate_async(raw_data)) is False
+
+        report = self.form.get_report()
+        assert report['messages'] == []
+        assert report['fields']['name']['values'][0]['messages'] == [
+            'NotEmpty']
+        assert report['fields']['repeat']['messages'] == ['NotEmpty']
+        assert report['fields']['age']['values'][0]['messages'] == [
+            'IsDigit']
+
+    def test_form_validator_fail(self):
+        raw_data = self._raw_data(name=['one'], repeat=['two'])
+
+        assert run(self.form.validate_async(raw_data)) is False
+        assert self.form.get_report()['messages'] == ['must match']
+
+    def test_sync_validate_raises_for_coroutines(self):
+        raw_data = self._raw_data(name=['one'], repeat=['one'], age=['1'])
+
+        with raises(TypeError):
+            self.form.validate(raw_data)
+
+    def test_sync_form_validator_raises_for_coroutine(self):
+        form = Form()
+        form.add_form_validator(AsyncMustMatch())
+
+        with raises(TypeError):
+            form._validate_form_validators()
+
+    def test_overridden_hooks(self):
+        class MakeValue(FieldValidator):
+
+            def make_value(self, field_value):
+                if field_value.value == 'bad':
+                    field_value.set_error('make_value')
+
+        class Call(FormValidator):
+
+            def __call__(self):
+                self.form.messages.append('called')
+
+        form = Form()
+        form.add_field('name', validators=[MakeValue()])
+        form.add_form_validator(Call())
+        raw_data = {form.form_name_value: [form.get_name()], 'name': ['x']}
+
+        assert run(form.validate_async(raw_data)) is True
+        assert form.messages == ['called']
+
+        form.reset()
+        raw_data['name'] = ['bad']
+        assert run(form.validate_async(raw_data)) is False
+        assert form.get_report()['fields']['name']['values'][0][
+            'messages'] == ['make_value']
+
+    def test_same_as_sync(self):
+        raw_data = self._raw_data(name=[''], repeat=['two'], age=['x'])
+        form = Form()
+        form.add_field('name', validators=[NotEmpty()])
+        form.add_field('repeat', validators=[NotEmpty()])
+        form.add_field('age', validators=[IsDigit()], convert=ToInt())
+
+        form.validate(raw_data)
+        run(self.form.validate_async(raw_data))
+
+        assert self.form.get_report()['fields'] == form.get_report()['fields']
+
+
+class ErrorBudgetTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = Form()
+        self.form.max_errors = 2
+        for name in ['one', 'two', 'three']:
+            self.form.add_field(name, validators=[NotEmpty()])
+        self.form.add_form_validator(ExampleFormValidator())
+
+    def _raw_data(self, **kwargs):
+        data = {self.form.form_name_value: [self.form.get_name()]}
+        data.update(kwargs)
+        return data
+
+    def _get_errors(self):
+        return [field.error for field in self.form.fields.values()]
+
+    def test_stops_after_max_errors(self):
+        assert self.form.validate(self._raw_data()) is False
+
+        assert self._get_errors() == [True, True, False]
+        assert self.form.messages == []
+
+    def test_fail_fast(self):
+        self.form.max_errors = 1
+
+        assert self.form.validate(self._raw_data(one=['x'])) is False
+
+        assert self._get_errors() == [False, True, False]
+
+    def test_counter_is_reset(self):
+        self.form.validate(self._raw_data())
+        self.form.reset()
+
+        assert self.form.validate(self._raw_data(one=['x'])) is False
+        assert self._get_errors() == [False, True, True]
+
+    def test_validate_many(self):
+        self.form.max_errors = 1
+
+        results = list(self.form.validate_many([
+            self._raw_data(),
+            self._raw_data(one=['x']),
+            self._raw_data(one=['x'], two=['x'], three=['x']),
+        ]))
+
+        assert [result[0] for result in results] == [False, False, True]
+        assert results[1][2]['fields']['two']['messages'] == ['NotEmpty']
+
+    def test_skipped_fields_are_not_success(self):
+        self.form.max_errors = 1
+        self.form.validate(self._raw_data())
+        self.form.fields['one'].reset()
+
+        assert self.form._validate_fields() is False
+
+    def test_async(self):
+        assert run(self.form.validate_async(self._raw_data())) is False
+
+        assert self._get_errors() == [True, True, False]
+
+    def test_default_is_exhaustive(self):
+        self.form.max_errors = None
+
+        assert self.form.validate(self._raw_data()) is False
+
+        assert self._get_errors() == [True, True, True]
+
+
 class TestGetAndSet(TestCase):
 
     def setUp(self):
@@ -241,6 +567,12 @@ class GetDataDictTest(TestCase):
             'name2': ['two', 'three'],
         }
 
+    def test_iter_data(self):
+        assert list(self.form.iter_data()) == [
+            ((), 'name1', ['one']),
+            ((), 'name2', ['two', 'three']),
+        ]
+
     def test_dict_minified(self):
         assert self.form.get_data_dict(True) == {
             'name1': 'one',
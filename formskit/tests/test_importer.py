@@ -0,0 +1,184 @@
+from pytest import fixture
+
+from formskit.converters import ToInt
+from formskit.form import Form
+from formskit.importer import FormImporter
+from formskit.tree_form import TreeForm
+from formskit.validators import NotEmpty, IsDigit
+
+
+class ExampleForm(Form):
+
+    def create_form(self):
+        self.add_field('name', validators=[NotEmpty()])
+        self.add_field('age', validators=[IsDigit()], convert=ToInt())
+
+
+class ChildForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('surname')
+
+
+class ExampleTreeForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('name')
+        self.add_sub_form(ChildForm())
+
+
+class TestFormImporter(object):
+
+    @fixture
+    def importer(self):
+        return FormImporter(ExampleForm(), chunk_size=2)
+
+    @fixture
+    def csv_path(self, tmpdir):
+        path = tmpdir.join('data.csv')
+        path.write(
+            'name,age,other\n'
+            'one,1,x\n'
+            ',2,x\n'
+            'three,bad,x\n')
+        return str(path)
+
+    @fixture
+    def jsonl_path(self, tmpdir):
+        path = tmpdir.join('data.jsonl')
+        path.write(
+            '{"name": "one", "age": "1"}\n'
+            '\n'
+            '{"name": ["two"], "age": "x"}\n'
+            'not json\n'
+            '[1, 2]\n')
+        return str(path)
+
+    def test_import_csv(self, importer, csv_path):
+        chunks = list(importer.import_csv(csv_path))
+
+        assert len(chunks) == 2
+        valid, errors = chunks[0]
+        assert valid == [(2, {'name': ['one'], 'age': [1]})]
+        assert errors[0][0] == 3
+        assert errors[0][1] == {'name': '', 'age': '2', 'other': 'x'}
+        assert errors[0][2]['fields']['name']['values'][0]['messages'] == [
+            'NotEmpty']
+
+        valid, errors = chunks[1]
+        assert valid == []
+        assert errors[0][0] == 4
+
+    def test_columns(self, csv_path):
+        importer = FormImporter(
+            ExampleForm(), columns={'other': 'name', 'name': 'skipped'})
+
+        valid, errors = next(importer.import_csv(csv_path))
+
+        assert [data['name'] for line, data in valid] == [['x'], ['x']]
+
+    def test_minified(self, csv_path):
+        importer = FormImporter(ExampleForm(), minified=True)
+
+        valid, errors = next(importer.import_csv(csv_path))
+
+        assert valid[0] == (2, {'name': 'one', 'age': 1})
+
+    def test_import_jsonl(self, importer, jsonl_path):
+        chunks = list(importer.import_jsonl(jsonl_path))
+
+        valid, errors = chunks[0]
+        assert valid == [(1, {'name': ['one'], 'age': [1]})]
+        assert errors[0][0] == 3
+        assert errors[0][2]['success'] is False
+
+        valid, errors = chunks[1]
+        assert valid == []
+        assert [error[0] for error in errors] == [4, 5]
+        assert errors[0][1] == 'not json\n'
+        assert errors[0][2]['fields'] == {}
+
+    def test_max_errors(self):
+        form = ExampleForm()
+        form.max_errors = 1
+        importer = FormImporter(form)
+
+        valid, errors = next(importer.import_rows([
+            (1, {'name': ''}),
+            (2, {'name': '', 'age': 'x'}),
+            (3, {'name': 'three', 'age': 'x'}),
+            (4, {'name': 'four'}),
+        ]))
+
+        assert [error[0] for error in errors] == [1, 2, 3]
+        assert valid == [(4, {'name': ['four'], 'age': []})]
+
+    def test_row_errors(self):
+        form = ExampleTreeForm()
+        form.max_values_per_field = 1
+        importer = FormImporter(form)
+
+        valid, errors = next(importer.import_rows([
+            (1, {'name': ['one', 'two']}),
+            (2, {'ChildForm': [{'other': ['x']}]}),
+            (3, {'name': 'three'}),
+        ]))
+
+        assert [error[0] for error in errors] == [1, 2]
+        assert errors[0][2]['messages'] == [
+            'LimitExceeded: max_values_per_field']
+        assert errors[1][2]['messages'] == ["KeyError: 'other'"]
+        assert valid[0][0] == 3
+
+    def test_hooks(self):
+        calls = []
+        form = ExampleForm()
+        form.on_success = lambda: calls.append('success')
+        form.on_fail = lambda: calls.append('fail')
+
+        list(FormImporter(form).import_rows([
+            (1, {'name': 'one'}), (2, {'name': ''})]))
+
+        assert calls == ['success', 'fail']
+
+    def test_tree_form(self):
+        importer = FormImporter(ExampleTreeForm())
+
+        valid, errors = next(importer.import_rows([
+            (1, {'name': 'one', 'ChildForm': [{'surname': ['s1']}]}),
+        ]))
+
+        assert valid == [(1, {
+            'name': ['one'],
+            'ChildForm': {0: {'surname': ['s1']}},
+        })]
+
+    def test_bad_sub_form_rows(self, tmpdir):
+        path = tmpdir.join('data.jsonl')
+        path.write(
+            '{"ChildForm": "oops"}\n'
+            '{"ChildForm": [5]}\n'
+            '{"name": "one", "ChildForm": [{"surname": "s1"}]}\n')
+        importer = FormImporter(ExampleTreeForm())
+
+        valid, errors = next(importer.import_jsonl(str(path)))
+
+        assert [error[0] for error in errors] == [1, 2]
+        assert errors[0][2]['messages'] == [
+            "Sub form ChildForm is not a list: 'oops'"]
+        assert errors[1][2]['messages'] == [
+            'Row of sub form ChildForm is not an object: 5']
+        assert [line for line, data in valid] == [3]
+
+    def test_lazy(self, importer):
+        read = []
+
+        def rows():
+            for index in range(10):
+                read.append(index)
+                yield index, {'name': 'name', 'age': '1'}
+
+        chunks = importer.import_rows(rows())
+        next(chunks)
+
+        assert read == [0, 1]
@@ -0,0 +1,92 @@
+from pytest import raises
+
+from formskit.form import WrongValueName
+from formskit.name_codecs import JsonNameCodec, PathNameCodec
+from formskit.tests.base import FormskitTestCase
+from formskit.tree_form import TreeForm
+
+PARENTS = [
+    {'name': 'MainForm', 'index': None},
+    {'name': 'PeopleForm', 'index': 3},
+    {'name': 'AddressForm', 'index': 0},
+]
+
+
+class JsonNameCodecTests(FormskitTestCase):
+
+    def test_round_trip(self):
+        codec = JsonNameCodec()
+
+        raw = codec.encode('street', PARENTS)
+
+        assert codec.decode(raw) == (
+            'street', (('PeopleForm', 3), ('AddressForm', 0)))
+
+    def test_no_parents(self):
+        codec = JsonNameCodec()
+
+        with raises(ValueError):
+            codec.decode(codec.encode('street', []))
+
+
+class PathNameCodecTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.codec = PathNameCodec()
+
+    def test_encode(self):
+        assert self.codec.encode('street', PARENTS) == (
+            'PeopleForm.3.AddressForm.0.street')
+        assert self.codec.encode('name', PARENTS[:1]) == 'name'
+
+    def test_encode_separator(self):
+        with raises(ValueError):
+            self.codec.encode('my.name', PARENTS)
+
+    def test_decode(self):
+        assert self.codec.decode('PeopleForm.3.AddressForm.0.street') == (
+            'street', (('PeopleForm', 3), ('AddressForm', 0)))
+        assert self.codec.decode(b'name') == ('name', ())
+
+    def test_decode_malformed(self):
+        for raw in ['PeopleForm.name', 'PeopleForm.x.name', 'PeopleForm.-1.n']:
+            with raises(ValueError):
+                self.codec.decode(raw)
+
+
+class PathForm(TreeForm):
+
+    name_codec = PathNameCodec()
+
+
+class TreeFormCodecTests(FormskitTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = PathForm()
+        self.form.add_field('one')
+        sub_form = PathForm()
+        sub_form.add_field('two')
+        self.form.add_sub_form(sub_form)
+
+    def test_validate(self):
+        name = self.form.get_or_create_sub_form('PathForm', 2).fields[
+            'two'].get_name()
+
+        assert name == 'PathForm.2.two'
+
+        self.form.validate({
+            self.form.form_name_value: [self.form.get_name()],
+            'one': ['value1'],
+            'PathForm.1.two': ['value2'],
+        })
+
+        assert self.form.get_data_dict(True) == {
+            'one': 'value1',
+            'PathForm': {0: {}, 1: {'two': 'value2'}, 2: {}},
+        }
+
+    def test_wrong_name(self):
+        with raises(WrongValueName):
+            self.form._get_field('PathForm.x.two')
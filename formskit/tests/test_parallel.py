@@ -0,0 +1,70 @@
+from unittest import TestCase
+from pytest import raises
+
+from formskit.converters import ToInt
+from formskit.errors import NotPicklable
+from formskit.form import Form
+from formskit.parallel import validate_parallel, _chunks, _validate_chunk
+from formskit.validators import IsDigit
+
+
+class ExampleForm(Form):
+
+    def create_form(self):
+        self.add_field('number', validators=[IsDigit()], convert=ToInt())
+
+
+def raw_data(value):
+    return {
+        ExampleForm.form_name_value: ['ExampleForm'],
+        'number': [value],
+    }
+
+
+class ValidateParallelTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.data = [raw_data(str(index)) for index in range(7)]
+        self.data[3] = raw_data('bad')
+
+    def test_ordered(self):
+        results = list(validate_parallel(
+            ExampleForm, self.data, workers=2, chunk_size=2))
+
+        assert [result[0] for result in results] == list(range(7))
+        assert [result[1] for result in results] == [
+            True, True, True, False, True, True, True]
+        assert results[6][2] == {'number': [6]}
+        assert results[3][3]['fields']['number']['values'][0][
+            'messages'] == ['IsDigit']
+
+    def test_unordered(self):
+        results = list(validate_parallel(
+            ExampleForm, self.data, workers=2, chunk_size=3, ordered=False))
+
+        results.sort(key=lambda result: result[0])
+        assert [result[0] for result in results] == list(range(7))
+        assert results[3][1] is False
+
+    def test_not_picklable(self):
+        class LocalForm(Form):
+            pass
+
+        with raises(NotPicklable):
+            validate_parallel(LocalForm, self.data)
+
+
+class ChunksTest(TestCase):
+
+    def test_chunks(self):
+        assert list(_chunks(range(5), 2)) == [
+            (0, [0, 1]),
+            (2, [2, 3]),
+            (4, [4]),
+        ]
+
+    def test_validate_chunk(self):
+        results = _validate_chunk(ExampleForm, 10, [raw_data('1')])
+
+        assert results[0][:3] == (10, True, {'number': [1]})
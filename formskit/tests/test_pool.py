@@ -0,0 +1,119 @@
+from unittest import TestCase
+from pytest import raises
+
+from formskit.form import Form
+from formskit.pool import FormPool
+from formskit.tree_form import TreeForm
+from formskit.validators import NotEmpty
+
+
+class ExampleForm(Form):
+
+    def create_form(self):
+        self.add_field('name', validators=[NotEmpty()])
+        self.add_field('hidden', ignore=True)
+
+
+class ChildForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('surname', validators=[NotEmpty()])
+
+
+class ExampleTreeForm(TreeForm):
+
+    def create_form(self):
+        self.add_field('name')
+        self.add_sub_form(ChildForm())
+
+
+class FormPoolTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.pool = FormPool(ExampleForm, max_size=2)
+
+    def test_acquire_from_empty(self):
+        form = self.pool.acquire()
+
+        assert isinstance(form, ExampleForm)
+        assert self.pool.created == 1
+        assert self.pool.reused == 0
+
+    def test_reuse(self):
+        form = self.pool.acquire()
+        self.pool.release(form)
+
+        assert self.pool.acquire() is form
+        assert self.pool.reused == 1
+        assert len(self.pool) == 0
+
+    def test_release_clears_form(self):
+        form = self.pool.acquire()
+        form.set_value('hidden', 'secret', force=True)
+        form.fields['hidden'].set_error('error')
+        assert form.validate({
+            form.form_name_value: [form.get_name()],
+        }) is False
+
+        self.pool.release(form)
+
+        assert form.success is None
+        assert form.raw_data is None
+        for field in form.fields.values():
+            assert field.values == []
+            assert field.messages == []
+            assert field.error is False
+
+    def test_eviction(self):
+        forms = [self.pool.acquire() for index in range(3)]
+        for form in forms:
+            self.pool.release(form)
+
+        assert len(self.pool) == 2
+        assert self.pool.evicted == 1
+        assert self.pool.acquire() is forms[2]
+        assert self.pool.acquire() is forms[1]
+
+    def test_release_wrong_class(self):
+        with raises(TypeError):
+            self.pool.release(Form())
+
+    def test_release_twice(self):
+        form = self.pool.acquire()
+        self.pool.release(form)
+
+        with raises(ValueError):
+            self.pool.release(form)
+
+        assert len(self.pool) == 1
+        assert self.pool.acquire() is form
+        assert self.pool.acquire() is not form
+
+    def test_context_manager(self):
+        with self.pool.form() as form:
+            form.set_value('name', 'value')
+
+        assert len(self.pool) == 1
+        assert form.get_values('name') == []
+
+    def test_get(self):
+        pool = FormPool.get(ExampleTreeForm, 3)
+
+        assert FormPool.get(ExampleTreeForm) is pool
+        assert pool.max_size == 3
+
+    def test_tree_form_sub_forms_are_removed(self):
+        pool = FormPool(ExampleTreeForm)
+        form = pool.acquire()
+        form.parse_dict({
+            'ChildForm': [{'surname': 'one'}, {'surname': ''}],
+        })
+        form._validate()
+
+        pool.release(form)
+
+        assert list(form.childs['ChildForm']) == [0]
+        child = form.get_sub_form('ChildForm', 0)
+        assert child.fields['surname'].values == []
+        assert child.fields['surname'].error is False
@@ -1,7 +1,7 @@
 from pytest import fixture
 from mock import create_autospec
 
-from formskit.translation import Translation, Translable
+from formskit.translation import LazyTranslation, Translation, Translable
 from formskit.tests.base import FormskitTestCase
 
 
@@ -39,6 +39,48 @@ class TranslationTests(FormskitTestCase):
         assert casted() == 'text one twosomething'
 
 
+class TestLazyTranslation(object):
+
+    @fixture
+    def owner(self):
+        owner = create_autospec(Translable)
+        owner._get_message_object = lambda: Translation()
+        return owner
+
+    def test_init(self, owner):
+        """
+        .__init__ should only store the text and arguments.
+        """
+        message = LazyTranslation(owner, 'text {0} {two}', 'one', two='two')
+
+        assert message.text == 'text {0} {two}'
+        assert message.args == ('one',)
+        assert message.kwargs == {'two': 'two'}
+
+    def test_call(self, owner):
+        """
+        .__call__ should make translation from the owner and translate it.
+        """
+        message = LazyTranslation(owner, 'text {0} {two}', 'one', two='two')
+
+        assert message() == 'text one two'
+
+    def test_translation_class(self, owner):
+        """
+        .translation should use translation class known at reading time.
+        """
+        class InheritedTranslation(Translation):
+
+            def translate(self):
+                return self.text + 'something'
+
+        message = LazyTranslation(owner, 'text')
+        owner._get_message_object = lambda: InheritedTranslation()
+
+        assert isinstance(message.translation(), InheritedTranslation)
+        assert message() == 'textsomething'
+
+
 class TestTranslable(object):
 
     @fixture
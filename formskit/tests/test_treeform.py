@@ -1,10 +1,17 @@
+from asyncio import run, sleep
+from base64 import urlsafe_b64encode
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from json import dumps
 from mock import create_autospec
 from unittest import TestCase
 from pytest import raises
 
+from formskit.cache import LRUCache
+from formskit.errors import LimitExceeded
 from formskit.field import Field
-from formskit.form import WrongValueName
-from formskit.tree_form import TreeForm
+from formskit.form import Form, WrongValueName
+from formskit.tree_form import SubForms, TreeForm
 from formskit.validators import NotEmpty, IsDigit
 from formskit.formvalidators import FormValidator
 
@@ -29,6 +36,87 @@ class TreeFormTest(TestCase):
         assert len(form.childs[form2_name]) == 1
         form2.reset.assert_called_once_with()
 
+    def test_reset_only_dirty_sub_forms(self):
+        form = TreeForm()
+        form2 = create_autospec(TreeForm())
+        form.add_sub_form(form2)
+        form.reset()
+        form2.reset.reset_mock()
+
+        form.reset()
+
+        assert form2.reset.call_count == 0
+
+    def test_reset_sub_form_after_value_set(self):
+        form = TreeForm()
+        form2 = TreeForm()
+        form2.add_field('name')
+        form.add_sub_form(form2)
+        form.reset()
+
+        form.get_or_create_sub_form('TreeForm', 0).set_value('name', 'one')
+        form.get_or_create_sub_form('TreeForm', 1).set_value('name', 'two')
+
+        assert form._dirty_sub_forms == {'TreeForm'}
+
+        form.reset()
+
+        assert list(form.childs['TreeForm']) == [0]
+        assert form2.get_values('name') == []
+        assert form._dirty_sub_forms == set()
+
+    def test_clone_sub_form(self):
+        form = TreeForm()
+        form2 = TreeForm()
+        form2.add_field('name', validators=[NotEmpty()])
+        form.add_sub_form(form2)
+        form2.set_value('name', 'one')
+
+        clone = form.get_or_create_sub_form('TreeForm', 1)
+
+        assert clone is not form2
+        assert clone.parent is form
+        assert clone.index == 1
+        assert clone.fields['name'] is not form2.fields['name']
+        assert clone.fields['name'].form is clone
+        assert clone.fields['name'].validators[0].field is clone.fields['name']
+        assert clone.get_values('name') == []
+
+    def test_clone_sub_form_with_attributes(self):
+        form = TreeForm()
+        form.add_sub_form(ChoicesForm())
+
+        clone = form.get_or_create_sub_form('ChoicesForm', 1)
+
+        assert clone.prefix == 'row'
+        assert clone.fields['choice'].avalible_values == ['row1']
+
+    def test_reuse_spare_sub_forms(self):
+        form = TreeForm()
+        form2 = TreeForm()
+        form2.add_field('name')
+        form.add_sub_form(form2)
+        clone = form.get_or_create_sub_form('TreeForm', 1)
+        clone.set_value('name', 'one')
+
+        form.reset()
+
+        assert form._spare_sub_forms == {'TreeForm': [clone]}
+        assert form.get_or_create_sub_form('TreeForm', 5) is clone
+        assert clone.index == 5
+        assert clone.get_values('name') == []
+
+    def test_max_spare_sub_forms(self):
+        form = TreeForm()
+        form.max_spare_sub_forms = 2
+        form.add_sub_form(TreeForm())
+        for index in range(1, 5):
+            form.get_or_create_sub_form('TreeForm', index)
+
+        form.reset()
+
+        assert len(form._spare_sub_forms['TreeForm']) == 2
+
     def test_parse_test_data(self):
         form = TreeForm()
         form.add_field('name')
@@ -60,6 +148,103 @@ class TreeFormTest(TestCase):
             form._parse_raw_data(raw_data)
 
 
+class SubFormsTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.sub_forms = SubForms('first')
+
+    def test_get(self):
+        assert self.sub_forms[0] == 'first'
+        for index in [1, -1]:
+            with raises(KeyError):
+                self.sub_forms[index]
+
+    def test_set_sparse(self):
+        self.sub_forms[3] = 'third'
+        self.sub_forms[2] = 'second'
+
+        assert len(self.sub_forms) == 3
+        assert list(self.sub_forms) == [0, 2, 3]
+        assert list(self.sub_forms.values()) == ['first', 'second', 'third']
+        assert 1 not in self.sub_forms
+        with raises(KeyError):
+            self.sub_forms[1]
+
+    def test_delete(self):
+        self.sub_forms[1] = 'second'
+        self.sub_forms[3] = 'third'
+
+        del self.sub_forms[3]
+
+        assert list(self.sub_forms) == [0, 1]
+        assert len(self.sub_forms) == 2
+        assert self.sub_forms.append('new') == 2
+        for index in [0, 3]:
+            with raises(KeyError):
+                del self.sub_forms[index]
+
+    def test_append(self):
+        assert self.sub_forms.append('second') == 1
+        assert list(self.sub_forms.items()) == [(0, 'first'), (1, 'second')]
+
+    def test_truncate(self):
+        self.sub_forms[2] = 'second'
+
+        assert self.sub_forms.truncate() == ['second']
+        assert list(self.sub_forms.items()) == [(0, 'first')]
+        assert len(self.sub_forms) == 1
+
+
+class NameCacheTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = TreeForm()
+        self.form.name_cache = LRUCache(10)
+        self.form.add_field('one')
+        self.name = self.form.fields['one'].get_name()
+
+    def test_cache(self):
+        assert self.form._get_field(self.name) is self.form.fields['one']
+        assert self.form._get_field(self.name) is self.form.fields['one']
+
+        assert self.form.name_cache.misses == 1
+        assert self.form.name_cache.hits == 1
+        key = (self.form.name_codec, self.name)
+        assert self.form.name_cache.get(key) == ('one', ())
+
+    def test_malformed_not_cached(self):
+        for name in [b'!!!', urlsafe_b64encode(b'[1, 2]'), b'']:
+            with raises(WrongValueName):
+                self.form._get_field(name)
+
+        assert len(self.form.name_cache) == 0
+
+    def test_unknown_field_not_cached(self):
+        name = urlsafe_b64encode(dumps({
+            'name': 'two',
+            'parents': [{'name': 'TreeForm', 'index': None}],
+        }).encode())
+
+        with raises(WrongValueName):
+            self.form._get_field(name)
+
+        assert len(self.form.name_cache) == 0
+
+    def test_wrong_index(self):
+        name = urlsafe_b64encode(dumps({
+            'name': 'one',
+            'parents': [
+                {'name': 'TreeForm', 'index': None},
+                {'name': 'TreeForm', 'index': [1]},
+            ],
+        }).encode())
+
+        with raises(WrongValueName):
+            self.form._get_field(name)
+
+
 class TreeFormsTest(TestCase):
 
     def setUp(self):
@@ -117,6 +302,516 @@ class TreeFormsTest(TestCase):
         assert field.error is True
 
 
+class ValidateManyTreeTest(TreeFormsTest):
+
+    def test_sub_forms_are_not_shared(self):
+        results = list(self.form.validate_many([
+            self._get_raw_data(),
+            {
+                self.form.form_name_value: [self.form.get_name()],
+                self.form.fields['one'].get_name(): ['other'],
+            },
+        ]))
+
+        assert sorted(results[0][1]['TreeForm']) == [0, 2, 3]
+        assert results[0][1]['TreeForm'][3] == {'two': ['value3']}
+        assert results[1][0] is False
+        assert results[1][1] == {
+            'one': ['other'],
+            'TreeForm': {0: {'two': []}},
+        }
+
+
+class ChoicesForm(TreeForm):
+
+    def create_form(self):
+        self.prefix = 'row'
+        self.add_field('choice')
+        self.fields['choice'].set_avalible_values(self.choices)
+
+    def choices(self):
+        return [self.prefix + str(self.index)]
+
+
+class CountingNotEmpty(NotEmpty):
+
+    # Validators are deep copied for new sub forms, but functions are not, so
+    # all the copies report to the same list.
+
+    def __init__(self, calls):
+        super().__init__()
+        self.record = lambda value: calls.append(value)
+
+    def validate_value(self):
+        self.record(self.value)
+        return super().validate_value()
+
+
+class IncrementalValidationTest(TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.validator = CountingNotEmpty(self.calls)
+        self.form = TreeForm()
+        self.form.incremental_validation = True
+        self.form.add_field('one')
+
+        subform = TreeForm()
+        subform.add_field('two', validators=[self.validator])
+        self.form.add_sub_form(subform)
+
+    def _get_raw_data(self, value):
+        return {
+            self.form.form_name_value: [self.form.get_name()],
+            self.form.fields['one'].get_name(): ['value1'],
+            self._get_name(0): ['value2'],
+            self._get_name(2): [value],
+        }
+
+    def _get_name(self, index):
+        form = self.form.get_or_create_sub_form('TreeForm', index)
+        return form.fields['two'].get_name()
+
+    def test_unchanged_sub_forms_are_skipped(self):
+        assert self.form.validate(self._get_raw_data('')) is False
+        del self.calls[:]
+
+        assert self.form.validate(self._get_raw_data('')) is False
+
+        assert self.calls == []
+        assert self.form.get_report()['success'] is False
+        field = self.form.get_sub_form('TreeForm', 2).fields['two']
+        assert field.error is True
+        assert len(field.values[0].messages) == 1
+
+    def test_changed_sub_form_is_validated_again(self):
+        assert self.form.validate(self._get_raw_data('')) is False
+        del self.calls[:]
+
+        assert self.form.validate(self._get_raw_data('value3')) is True
+
+        assert self.calls == ['value3']
+        field = self.form.get_sub_form('TreeForm', 2).fields['two']
+        assert field.error is False
+        assert field.values[0].messages == []
+
+    def test_same_result_as_full_validation(self):
+        self.form.validate(self._get_raw_data(''))
+        self.form.validate(self._get_raw_data('value3'))
+        incremental = self.form.get_report()
+
+        self.form.incremental_validation = False
+        self.form.reset()
+        self.form.validate(self._get_raw_data('value3'))
+
+        assert self.form.get_report() == incremental
+
+    def test_reset_forces_full_validation(self):
+        self.form.validate(self._get_raw_data('value3'))
+        del self.calls[:]
+
+        self.form.reset()
+        self.form.validate(self._get_raw_data('value3'))
+
+        assert sorted(self.calls) == ['value2', 'value3']
+
+    def test_removed_row(self):
+        raw_data = self._get_raw_data('')
+        assert self.form.validate(raw_data) is False
+
+        del raw_data[self._get_name(2)]
+
+        assert self.form.validate(raw_data) is True
+        assert list(self.form.childs['TreeForm']) == [0]
+        assert self.form.get_data_dict() == {
+            'one': ['value1'],
+            'TreeForm': {0: {'two': ['value2']}},
+        }
+        assert self.form._sub_forms_count == 0
+
+    def test_removed_field(self):
+        raw_data = self._get_raw_data('value3')
+        self.form.validate(raw_data)
+
+        del raw_data[self.form.fields['one'].get_name()]
+        del raw_data[self._get_name(0)]
+
+        assert self.form.validate(raw_data) is False
+        assert self.form.get_data_dict() == {
+            'one': [],
+            'TreeForm': {0: {'two': []}, 2: {'two': ['value3']}},
+        }
+
+    def test_removed_row_is_reused(self):
+        raw_data = self._get_raw_data('value3')
+        self.form.validate(raw_data)
+        removed = self.form.get_sub_form('TreeForm', 2)
+        del raw_data[self._get_name(2)]
+        self.form.validate(raw_data)
+
+        raw_data = self._get_raw_data('')
+
+        assert self.form.validate(raw_data) is False
+        assert self.form.get_sub_form('TreeForm', 2) is removed
+        assert self.form.get_sub_form('TreeForm', 2).success is False
+
+    def test_set_value_marks_parents_changed(self):
+        self.form.validate(self._get_raw_data('value3'))
+        sub_form = self.form.get_sub_form('TreeForm', 2)
+
+        sub_form.set_value('two', '')
+
+        assert sub_form._changed is True
+        assert self.form._changed is True
+        assert self.form.get_sub_form('TreeForm', 0)._changed is False
+
+
+class BarrierNotEmpty(NotEmpty):
+
+    def __init__(self, barrier):
+        super().__init__()
+        self.wait = lambda: barrier.wait()
+
+    def validate_value(self):
+        self.wait()
+        return super().validate_value()
+
+
+class ValidationExecutorTest(TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(3)
+        self.form = TreeForm()
+        self.form.add_field('one')
+
+        subform = TreeForm()
+        subform.add_field('two', validators=[NotEmpty()])
+        self.form.add_sub_form(subform)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _get_raw_data(self):
+        raw_data = {
+            self.form.form_name_value: [self.form.get_name()],
+            self.form.fields['one'].get_name(): ['value1'],
+        }
+        for index, value in enumerate(['value2', '', 'value3']):
+            sub_form = self.form.get_or_create_sub_form('TreeForm', index)
+            raw_data[sub_form.fields['two'].get_name()] = [value]
+        return raw_data
+
+    def test_same_result_as_sequential(self):
+        self.form.validate(self._get_raw_data())
+        sequential = self.form.get_report()
+
+        self.form.reset()
+        self.form.validation_executor = self.executor
+        assert self.form.validate(self._get_raw_data()) is False
+
+        assert self.form.get_report() == sequential
+        errors = [
+            sub_form.fields['two'].error
+            for sub_form in self.form.childs['TreeForm'].values()
+        ]
+        assert errors == [False, True, False]
+        field = self.form.get_sub_form('TreeForm', 1).fields['two']
+        assert field.values[0].messages[0].text == 'NotEmpty'
+
+    def test_sub_forms_are_validated_concurrently(self):
+        barrier = Barrier(3, timeout=5)
+        subform = TreeForm()
+        subform.add_field('two', validators=[BarrierNotEmpty(barrier)])
+        self.form.childs = {}
+        self.form.add_sub_form(subform)
+        self.form.validation_executor = self.executor
+
+        assert self.form.validate(self._get_raw_data()) is False
+        assert barrier.broken is False
+
+    def test_error_is_raised(self):
+        class Broken(NotEmpty):
+
+            def validate_value(self):
+                raise RuntimeError('broken')
+
+        subform = TreeForm()
+        subform.add_field('two', validators=[Broken()])
+        self.form.childs = {}
+        self.form.add_sub_form(subform)
+        self.form.validation_executor = self.executor
+
+        with raises(RuntimeError):
+            self.form.validate(self._get_raw_data())
+
+
+class RecordingNotEmpty(NotEmpty):
+
+    message = 'NotEmpty'
+
+    def __init__(self, events):
+        super().__init__()
+        self.record = lambda event: events.append(event)
+
+    async def validate_value(self):
+        self.record(('start', self.value))
+        await sleep(0)
+        self.record(('stop', self.value))
+        return super().validate_value()
+
+
+class ValidateAsyncTreeTest(ValidationExecutorTest):
+
+    def test_sub_forms_are_awaited_concurrently(self):
+        events = []
+        subform = TreeForm()
+        subform.add_field('two', validators=[RecordingNotEmpty(events)])
+        self.form.childs = {}
+        self.form.add_sub_form(subform)
+        raw_data = self._get_raw_data()
+
+        assert run(self.form.validate_async(raw_data)) is False
+
+        assert [event for event, value in events[:3]] == ['start'] * 3
+        field = self.form.get_sub_form('TreeForm', 1).fields['two']
+        assert field.values[0].messages[0].text == 'NotEmpty'
+        assert self.form.get_sub_form('TreeForm', 2).success is True
+
+    def test_same_result_as_sync(self):
+        self.form.validate(self._get_raw_data())
+        sync = self.form.get_report()
+
+        self.form.reset()
+        assert run(self.form.validate_async(self._get_raw_data())) is False
+
+        assert self.form.get_report() == sync
+
+
+class ErrorBudgetTreeTest(ValidationExecutorTest):
+
+    def test_sub_forms_are_skipped(self):
+        self.form.max_errors = 1
+        raw_data = self._get_raw_data()
+        name = self.form.get_sub_form('TreeForm', 0).fields['two'].get_name()
+        raw_data[name] = ['']
+
+        assert self.form.validate(raw_data) is False
+
+        assert [
+            sub_form.success
+            for sub_form in self.form.childs['TreeForm'].values()
+        ] == [False, None, None]
+
+
+class ExplainValidatorsTreeTest(TreeFormsTest):
+
+    def test_sub_forms(self):
+        explain = self.form.explain_validators()
+
+        assert explain['fields'] == {'one': []}
+        sub_form = explain['sub_forms']['TreeForm']
+        assert sub_form['fields']['two'][0]['validator'] == 'NotEmpty'
+        assert sub_form['sub_forms'] == {}
+
+
+class ErrorBudgetIncrementalTest(IncrementalValidationTest):
+
+    def test_skipped_sub_forms_are_not_cached(self):
+        self.form.max_errors = 1
+        raw_data = self._get_raw_data('value3')
+        bad_data = dict(raw_data)
+        bad_data[self._get_name(0)] = ['']
+
+        with ThreadPoolExecutor(1) as executor:
+            self.form.validation_executor = executor
+            assert self.form.validate(bad_data) is False
+            assert self.form.get_sub_form('TreeForm', 2).success is False
+
+            assert self.form.validate(raw_data) is True
+
+        assert self.form.get_sub_form('TreeForm', 2).success is True
+
+class GroupedParseTest(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.form = TreeForm()
+        self.form.add_field('one')
+        child = TreeForm()
+        child.add_field('two')
+        child.add_field('three')
+        grandchild = TreeForm()
+        grandchild.add_field('four')
+        child.add_sub_form(grandchild)
+        self.form.add_sub_form(child)
+
+    def _name(self, field, parents):
+        return self.form.name_codec.encode(field, [
+            {'name': 'TreeForm', 'index': index}
+            for index in [None] + parents
+        ])
+
+    def test_same_as_per_key(self):
+        raw_data = {
+            self._name('one', []): ['1'],
+            self._name('two', [0]): ['2'],
+            self._name('three', [0]): ['3'],
+            self._name('two', [1]): ['4'],
+            self._name('four', [1, 0]): ['5'],
+            self._name('four', [1, 2]): ['6'],
+        }
+        other = TreeForm()
+        other.add_field('one')
+        other.add_sub_form(
+            self.form.get_sub_form('TreeForm', 0)._clone_schema())
+
+        self.form._parse_raw_data(raw_data)
+        Form._parse_raw_data(other, raw_data)
+
+        assert self.form.get_data_dict(True) == other.get_data_dict(True)
+        assert self.form.get_data_dict(True)['TreeForm'][1] == {
+            'two': '4',
+            'TreeForm': {0: {'four': '5'}, 2: {'four': '6'}},
+        }
+
+    def test_sub_form_found_once(self):
+        raw_data = {
+            self._name('two', [3]): ['2'],
+            self._name('three', [3]): ['3'],
+        }
+        calls = []
+        get_or_create_sub_form = self.form.get_or_create_sub_form
+
+        def spy(name, index):
+            calls.append((name, index))
+            return get_or_create_sub_form(name, index)
+        self.form.get_or_create_sub_form = spy
+
+        self.form._parse_raw_data(raw_data)
+
+        assert calls == [('TreeForm', 3)]
+
+    def test_wrong_name_before_values_are_set(self):
+        raw_data = {
+            self._name('one', []): ['1'],
+            'wrong': ['2'],
+        }
+
+        with raises(WrongValueName):
+            self.form._parse_raw_data(raw_data)
+
+        assert self.form.get_values('one') == []
+
+    def test_wrong_sub_form(self):
+        raw_data = {
+            self.form.name_codec.encode('two', [
+                {'name': 'TreeForm', 'index': None},
+                {'name': 'Missing', 'index': 0},
+            ]): ['1'],
+        }
+
+        with raises(WrongValueName):
+            self.form._parse_raw_data(raw_data)
+
+
+class LimitsTest(GroupedParseTest):
+
+    def test_max_depth(self):
+        self.form.max_depth = 1
+        raw_data = {self._name('four', [0, 0]): ['1']}
+
+        with raises(LimitExceeded) as error:
+            self.form._parse_raw_data(raw_data)
+
+        assert error.value.name == 'max_depth'
+
+    def test_max_sub_form_index_before_creating(self):
+        self.form.max_sub_form_index = 5
+        raw_data = {
+            self._name('two', [1]): ['1'],
+            self._name('two', [6]): ['1'],
+        }
+
+        with raises(LimitExceeded):
+            self.form._parse_raw_data(raw_data)
+
+        assert list(self.form.childs['TreeForm']) == [0]
+
+    def test_max_value_bytes_parse_dict(self):
+        self.form.max_value_bytes = 5
+        data = {'one': '12', 'TreeForm': [{'two': ['34'], 'three': ['56']}]}
+
+        with raises(LimitExceeded) as error:
+            self.form.parse_dict(data)
+
+        assert error.value.name == 'max_value_bytes'
+        data['TreeForm'][0]['three'] = ['5']
+        self.form.parse_dict(data)
+
+    def test_no_limits(self):
+        self.form.max_depth = None
+        self.form.max_sub_form_index = None
+        self.form.max_sub_forms = None
+        raw_data = {
+            self._name('four', [20000, 1]): ['1'],
+        }
+
+        self.form._parse_raw_data(raw_data)
+        self.form.parse_dict({'TreeForm': [{}] * 3})
+
+        sub_form = self.form.get_sub_form('TreeForm', 20000)
+        assert sub_form.get_sub_form('TreeForm', 1).get_value('four') == '1'
+
+    def test_max_sub_forms_per_name(self):
+        self.form.max_sub_forms_per_name = 2
+        raw_data = {
+            self._name('two', [index]): ['1'] for index in range(3)
+        }
+
+        with raises(LimitExceeded) as error:
+            self.form._parse_raw_data(raw_data)
+
+        assert error.value.name == 'max_sub_forms_per_name'
+        assert list(self.form.childs['TreeForm']) == [0]
+
+    def test_max_sub_forms(self):
+        self.form.max_sub_forms = 3
+        raw_data = {
+            self._name('four', [1, 1]): ['1'],
+            self._name('four', [2, 1]): ['1'],
+        }
+
+        with raises(LimitExceeded) as error:
+            self.form._parse_raw_data(raw_data)
+
+        assert error.value.name == 'max_sub_forms'
+
+    def test_max_sub_forms_runtime(self):
+        self.form.max_sub_forms = 2
+        self.form.get_or_create_sub_form('TreeForm', 1)
+        self.form.get_or_create_sub_form('TreeForm', 2)
+
+        with raises(LimitExceeded):
+            self.form.get_or_create_sub_form('TreeForm', 3)
+
+        self.form.reset()
+        self.form.get_or_create_sub_form('TreeForm', 3)
+
+    def test_max_sub_forms_per_name_runtime(self):
+        self.form.max_sub_forms_per_name = 2
+        child = self.form.get_or_create_sub_form('TreeForm', 1)
+
+        with raises(LimitExceeded):
+            self.form.get_or_create_sub_form('TreeForm', 2)
+        child.get_or_create_sub_form('TreeForm', 1)
+
+    def test_parse_dict(self):
+        self.form.max_sub_forms = 1
+
+        with raises(LimitExceeded):
+            self.form.parse_dict({'TreeForm': [{}, {}, {}]})
+
+
 class GetDataDictTreeTest(TestCase):
 
     def setUp(self):
@@ -161,6 +856,52 @@ class GetDataDictTreeTest(TestCase):
             }
         }
 
+    def test_iter_data(self):
+        assert list(self.form.iter_data()) == [
+            ((), 'name1', ['one']),
+            ((('TreeForm', 0),), 'name2', ['two', 'three']),
+            ((('TreeForm', 1),), 'name2', ['four']),
+            ((('TreeForm', 2),), 'name2', []),
+        ]
+
+    def test_iter_data_minified(self):
+        assert list(self.form.iter_data(True)) == [
+            ((), 'name1', 'one'),
+            ((('TreeForm', 0),), 'name2', ['two', 'three']),
+            ((('TreeForm', 1),), 'name2', 'four'),
+        ]
+
+    def test_iter_data_is_lazy(self):
+        data = self.form.iter_data()
+        next(data)
+        self.form.get_sub_form('TreeForm', 1).set_values('name2', ['five'])
+
+        assert list(data)[1] == ((('TreeForm', 1),), 'name2', ['five'])
+
+    def test_tree_as_list(self):
+        assert self.form.get_data_dict(as_list=True) == {
+            'name1': ['one'],
+            'TreeForm': [
+                {'name2': ['two', 'three']},
+                {'name2': ['four']},
+                {'name2': []},
+            ]
+        }
+
+    def test_index_order(self):
+        self.form.get_or_create_sub_form('TreeForm', 5)
+        self.form.get_or_create_sub_form('TreeForm', 4)
+
+        assert list(self.form.get_data_dict()['TreeForm']) == [0, 1, 2, 4, 5]
+
+    def test_max_sub_form_index(self):
+        self.form.max_sub_form_index = 10
+
+        with raises(LimitExceeded):
+            self.form.get_or_create_sub_form('TreeForm', 11)
+        with raises(KeyError):
+            self.form.get_or_create_sub_form('TreeForm', -1)
+
     def test_tree_minified(self):
         assert self.form.get_data_dict(True) == {
             'name1': 'one',
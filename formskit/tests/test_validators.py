@@ -1,3 +1,5 @@
+import re
+
 from formskit.tests.base import FormskitTestCase
 from formskit.field import Field, FieldValue, AvalibleValue
 from formskit.translation import Translation
@@ -48,6 +50,18 @@ class ValidatorTestMixin(object):
                 assert field_value.messages == []
                 assert field_value.error is False
 
+    def test_make_values(self):
+        samples = self.good_samples + self.bad_samples
+        field_values = [FieldValue(self.field, sample) for sample in samples]
+
+        self.validator.make_values(field_values)
+
+        assert [field_value.error for field_value in field_values] == (
+            [False] * len(self.good_samples)
+            + [True] * len(self.bad_samples))
+        assert self.field.error is True
+        assert field_values[-1].messages[0].text == self.cls.__name__
+
     def _is_field_value_validator(self):
         return issubclass(self.cls, VAL.FieldValidator)
 
@@ -97,6 +111,23 @@ class EmailValidatorTest(ValidatorTestMixin, FormskitTestCase):
     ]
 
 
+class LowerCase(VAL.RegexValidator):
+    regex = re.compile('^[a-z]+$')
+    max_length = 10
+
+
+class RegexValidatorTest(ValidatorTestMixin, FormskitTestCase):
+    cls = LowerCase
+
+    good_samples = [
+        'a', 'abcdefghij',
+    ]
+
+    bad_samples = [
+        '', 'A', 'a1', 'abcdefghijk',
+    ]
+
+
 class IsDecimalTest(ValidatorTestMixin, FormskitTestCase):
     cls = VAL.IsDecimal
 
@@ -143,6 +174,17 @@ class IsValueInAvalibleValuesTest(FormskitTestCase):
         assert field_value.error is True
         assert field_value.messages[0].text == self.cls.__name__
 
+    def test_make_values(self):
+        self.validator.allow_empty = True
+        field_values = [
+            FieldValue(self.field, value) for value in ['5', '6', '', None]
+        ]
+
+        self.validator.make_values(field_values)
+
+        assert [field_value.error for field_value in field_values] == [
+            False, True, False, False]
+
     def test_good_method(self):
         def method():
             yield AvalibleValue('4')
@@ -208,6 +250,68 @@ class IsValueInAvalibleValuesTest(FormskitTestCase):
         assert field_value.messages[0].text == self.cls.__name__
 
 
+class TestMakeValues(object):
+
+    def test_without_batch(self):
+        """
+        .make_values should call validate_value for every value when
+        validate_values is not implemented.
+        """
+        class Example(VAL.FieldValidator):
+
+            def validate_value(self):
+                return self.value == 'good'
+
+        validator = Example()
+        field = ExampleField('name', [validator])
+        field_values = [FieldValue(field, 'good'), FieldValue(field, 'bad')]
+
+        validator.make_values(field_values)
+
+        assert [field_value.error for field_value in field_values] == [
+            False, True]
+
+    def test_overridden_validate_value(self):
+        """
+        .make_values should not use validate_values of parent class, when
+        validate_value was overridden.
+        """
+        class Example(VAL.NotEmpty):
+
+            def validate_value(self):
+                return self.value == 'good'
+
+        validator = Example()
+        field = ExampleField('name', [validator])
+        field_values = [FieldValue(field, 'good'), FieldValue(field, 'bad')]
+
+        validator.make_values(field_values)
+
+        assert validator._has_batch() is False
+        assert [field_value.error for field_value in field_values] == [
+            False, True]
+
+    def test_overridden_make_value(self):
+        """
+        .make_values should call make_value, when it was overridden.
+        """
+        class Example(VAL.NotEmpty):
+
+            def make_value(self, field_value):
+                if field_value.value == 'bad':
+                    field_value.set_error('bad')
+
+        validator = Example()
+        field = ExampleField('name', [validator])
+        field_values = [FieldValue(field, ''), FieldValue(field, 'bad')]
+
+        validator.make_values(field_values)
+
+        assert validator._has_batch() is False
+        assert [field_value.error for field_value in field_values] == [
+            False, True]
+
+
 class TestFieldValidatorInit(object):
 
     def test_custom_message(self):
@@ -231,3 +335,124 @@ class TestFieldValidatorInit(object):
         obj = Example3()
 
         assert obj.message == 'Example3'
+
+
+class TestRegexEngine(object):
+
+    def _get_field(self, *validators):
+        return ExampleField('name', list(validators))
+
+    def _validate(self, field, values):
+        field_values = [FieldValue(field, value) for value in values]
+        for validator in field.validators:
+            validator.make_values(field_values)
+        return [
+            [message.text for message in field_value.messages]
+            for field_value in field_values
+        ]
+
+    def test_combined(self):
+        field = self._get_field(
+            VAL.IsDigit(),
+            VAL.RegexValidator('[13579]$'),
+            VAL.RegexValidator(re.compile('^-', re.IGNORECASE)))
+
+        assert self._validate(field, ['-13', '12', 'a', '']) == [
+            [],
+            ['RegexValidator', 'RegexValidator'],
+            ['IsDigit', 'RegexValidator', 'RegexValidator'],
+            ['RegexValidator', 'RegexValidator'],
+        ]
+        assert field._regex_engine.regex is not None
+
+    def test_same_as_separate(self):
+        validators = [
+            VAL.RegexValidator('b+'),
+            VAL.RegexValidator(re.compile('^A', re.IGNORECASE)),
+            VAL.RegexValidator('c$', max_length=3),
+        ]
+        values = ['abc', 'Abbc', 'xbc', 'ab', 'a\nb', 'c']
+        combined = self._get_field(*validators)
+        separate = [
+            self._validate(self._get_field(validator), values)
+            for validator in validators
+        ]
+
+        result = self._validate(combined, values)
+
+        assert result == [
+            sum(messages, [])
+            for messages in zip(*separate)
+        ]
+
+    def test_same_as_separate_with_flags(self):
+        flags = [
+            0, re.ASCII, re.IGNORECASE, re.MULTILINE, re.DOTALL, re.VERBOSE,
+            re.ASCII | re.IGNORECASE,
+        ]
+        values = ['123', '\u0661\u0662\u0663', 'AB', 'a\nb', 'x\n1', '']
+        for flag in flags:
+            validators = [
+                VAL.RegexValidator(re.compile(r'^\d+$', flag)),
+                VAL.RegexValidator(re.compile(r'^a.b$|^ab', flag)),
+                VAL.RegexValidator(re.compile(r'^1$', flag)),
+            ]
+            separate = [
+                self._validate(self._get_field(validator), values)
+                for validator in validators
+            ]
+
+            result = self._validate(self._get_field(*validators), values)
+
+            assert result == [
+                sum(messages, []) for messages in zip(*separate)
+            ], flag
+
+    def test_ascii_is_kept(self):
+        field = self._get_field(
+            VAL.RegexValidator(re.compile(r'^\d+$', re.ASCII)),
+            VAL.RegexValidator('.'))
+
+        assert self._validate(field, ['\u0661\u0662\u0663']) == [
+            ['RegexValidator']]
+        assert field._regex_engine.regex is not None
+
+    def test_not_combinable(self):
+        validators = [
+            VAL.RegexValidator('(a)\\1'),
+            VAL.RegexValidator(re.compile('a # comment', re.VERBOSE)),
+            VAL.RegexValidator('b'),
+        ]
+        field = self._get_field(*validators)
+
+        assert self._validate(field, ['aa', 'b']) == [
+            ['RegexValidator'],
+            ['RegexValidator', 'RegexValidator'],
+        ]
+        assert field._regex_engine.regex is None
+
+    def test_matched_once(self):
+        field = self._get_field(
+            VAL.RegexValidator('a'), VAL.RegexValidator('b'))
+        engine = VAL.RegexEngine(field.validators)
+        calls = []
+        regex = engine.regex
+        engine.regex = type('Regex', (), {
+            'match': lambda self, value: calls.append(value)
+            or regex.match(value),
+        })()
+        field._regex_engine = engine
+
+        self._validate(field, ['ab', 'c'])
+
+        assert calls == ['ab', 'c']
+
+    def test_clone_has_own_engine(self):
+        field = self._get_field(
+            VAL.RegexValidator('a'), VAL.RegexValidator('b'))
+        self._validate(field, ['a'])
+
+        clone = field.clone()
+
+        assert clone._regex_engine is None
+        assert self._validate(clone, ['b']) == [['RegexValidator']]
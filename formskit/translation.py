@@ -20,7 +20,41 @@ class Translation(object):
         return self.text
 
 
-class Translable(object):
+class LazyTranslation(object):
+
+    """
+    Error message record. Translation object is made by the owner's
+    ``_get_message_object`` only when the message is read.
+    """
+
+    __slots__ = ('owner', 'text', 'args', 'kwargs')
+
+    def __init__(self, owner, text, *args, **kwargs):
+        self.owner = owner
+        self.text = text
+        self.args = args
+        self.kwargs = kwargs
+
+    def translation(self):
+        """
+        Make translation object for this message.
+        """
+        message = self.owner._get_message_object()
+        message.init(self.text, *self.args, **self.kwargs)
+        return message
+
+    def __call__(self):
+        return self.translation()()
+
+
+class TranslableBase(object):
+
+    """
+    Methods of Translable, without the place to keep messages, so subclasses
+    with ``__slots__`` can keep them in their own way.
+    """
+
+    __slots__ = ()
 
     def reset(self):
         """
@@ -36,3 +70,7 @@ class Translable(object):
             message()
             for message in self.messages
         ]
+
+
+class Translable(TranslableBase):
+    pass
@@ -1,29 +1,185 @@
-from base64 import urlsafe_b64decode
-from copy import deepcopy
-from json import loads
 import binascii
+from asyncio import gather
+from concurrent.futures import wait
 
+from .cache import LRUCache
+from .errors import LimitExceeded
 from .field import TreeField
 from .form import Form, WrongValueName
+from .name_codecs import JsonNameCodec
+
+
+class SubForms(object):
+
+    """
+    Sub forms of one name, kept in a list ordered by index. Works like a dict
+    of index to sub form, but iterates in index order.
+    """
+
+    __slots__ = ('_forms', '_count')
+
+    def __init__(self, form):
+        self._forms = [form]
+        self._count = 1
+
+    def __getitem__(self, index):
+        try:
+            form = self._forms[index] if index >= 0 else None
+        except IndexError:
+            form = None
+        if form is None:
+            raise KeyError(index)
+        return form
+
+    def __setitem__(self, index, form):
+        if index < 0:
+            raise KeyError(index)
+        missing = index + 1 - len(self._forms)
+        if missing > 0:
+            self._forms.extend([None] * missing)
+        if self._forms[index] is None:
+            self._count += 1
+        self._forms[index] = form
+
+    def __contains__(self, index):
+        try:
+            self[index]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index, form in enumerate(self._forms):
+            if form is not None:
+                yield index
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for form in self._forms:
+            if form is not None:
+                yield form
+
+    def items(self):
+        for index, form in enumerate(self._forms):
+            if form is not None:
+                yield index, form
+
+    def __delitem__(self, index):
+        if index <= 0 or index not in self:
+            raise KeyError(index)
+        self._forms[index] = None
+        self._count -= 1
+        while self._forms[-1] is None:
+            self._forms.pop()
+
+    def append(self, form):
+        """
+        Add sub form after the last one.
+
+        :returns: index of the sub form
+        """
+        self._forms.append(form)
+        self._count += 1
+        return len(self._forms) - 1
+
+    def truncate(self):
+        """
+        Remove all sub forms except the first one.
+
+        :returns: list of removed sub forms
+        """
+        removed = [form for form in self._forms[1:] if form is not None]
+        del self._forms[1:]
+        self._count = 1
+        return removed
 
 
 class TreeForm(Form):
 
+    max_depth = 32
+    max_sub_forms = 10000
+    max_sub_forms_per_name = None
+    max_sub_form_index = 10000
+    max_spare_sub_forms = 1000
+    incremental_validation = False
+    validation_executor = None
+    name_cache = LRUCache(10000)
+    name_codec = JsonNameCodec()
+
     def _init_before_create(self):
         super()._init_before_create()
         self.parent = None
         self.childs = {}
+        self._dirty_sub_forms = set()
+        self._spare_sub_forms = {}
+        self._sub_forms_count = 0
 
     def add_field(self, *args, **kwargs):
         field = TreeField(*args, **kwargs)
         self.add_field_object(field)
         return field
 
+    def _copy_schema(self, prototype):
+        super()._copy_schema(prototype)
+        for sub_forms in prototype.childs.values():
+            self.add_sub_form(sub_forms[0]._clone_schema())
+
+    def _clone_schema(self):
+        form = self.__class__.__new__(self.__class__)
+        form._init_before_create()
+        form._copy_schema(self)
+        form.reset()
+        return form
+
     def reset(self):
         super().reset()
-        for name in self.childs:
-            self.childs[name] = {0: self.childs[name][0]}
-            self.childs[name][0].reset()
+        self._sub_forms_count = 0
+        dirty_sub_forms = self._dirty_sub_forms
+        self._dirty_sub_forms = set()
+        for name in dirty_sub_forms:
+            sub_forms = self.childs[name]
+            self._keep_spare_sub_forms(name, sub_forms.truncate())
+            sub_forms[0].reset()
+
+    def _keep_spare_sub_forms(self, name, forms):
+        spare = self._spare_sub_forms.setdefault(name, [])
+        spare.extend(forms)
+        del spare[self.max_spare_sub_forms:]
+
+    def _set_field_dirty(self, field):
+        super()._set_field_dirty(field)
+        self._set_dirty()
+
+    def _set_dirty(self):
+        if self.parent is not None:
+            self.parent._set_sub_form_dirty(self.get_name())
+
+    def _set_changed(self):
+        if not self._changed:
+            self._changed = True
+            if self.parent is not None:
+                self.parent._set_changed()
+
+    def _set_sub_form_dirty(self, name):
+        if name not in self._dirty_sub_forms:
+            self._dirty_sub_forms.add(name)
+            self._set_dirty()
+
+    def clear(self):
+        super().clear()
+        for sub_forms in self.childs.values():
+            sub_forms[0].clear()
+
+    def _get_root(self):
+        form = self
+        while form.parent is not None:
+            form = form.parent
+        return form
 
     def _get_parents(self):
         if self.parent is None:
@@ -40,37 +196,158 @@ class TreeForm(Form):
 
     def add_sub_form(self, form):
         form._set_parent(self, 0)
-        self.childs[form.get_name()] = {0: form}
+        self.childs[form.get_name()] = SubForms(form)
+        self._spare_sub_forms.pop(form.get_name(), None)
+        self._set_sub_form_dirty(form.get_name())
 
     def _set_parent(self, parent, index):
+        if self.parent is parent and self.index == index:
+            return
         self.parent = parent
         self.index = index
+        self._reset_names()
+
+    def _reset_names(self):
+        for field in self.fields.values():
+            field._reset_name()
+        for sub_forms in self.childs.values():
+            for sub_form in sub_forms.values():
+                sub_form._reset_names()
+
+    def get_field_names(self):
+        """
+        Get names of all fields of this form and all sub forms, computed in
+        one pass. Result has the same shape as ``get_data_dict``.
+
+        :rtype: dict
+        """
+        return self._get_field_names(self._get_parents())
+
+    def _get_field_names(self, parents):
+        names = {}
+        for name, field in self.fields.items():
+            names[name] = field._get_name(parents)
+        for name, sub_forms in self.childs.items():
+            names[name] = {}
+            for index, sub_form in sub_forms.items():
+                names[name][index] = sub_form._get_field_names(
+                    parents + [sub_form._get_form_info()])
+        return names
 
     def get_or_create_sub_form(self, name, index):
         try:
             return self.get_sub_form(name, index)
         except KeyError:
+            if index < 0:
+                raise
+            self._check_new_sub_form(name, index)
             form = self._clone_sub_form(name)
             self.childs[name][index] = form
-            form.index = index
+            form._set_parent(self, index)
+            self._set_sub_form_dirty(name)
+            self._set_changed()
             return form
 
+    def _check_new_sub_form(self, name, index):
+        sub_forms = self.childs[name]
+        root = self._get_root()
+        limit = root.max_sub_form_index
+        if limit is not None and index > limit:
+            raise LimitExceeded('max_sub_form_index', limit)
+        limit = root.max_sub_forms_per_name
+        if limit is not None and len(sub_forms) >= limit:
+            raise LimitExceeded('max_sub_forms_per_name', limit)
+        limit = root.max_sub_forms
+        if limit is not None and root._sub_forms_count >= limit:
+            raise LimitExceeded('max_sub_forms', limit)
+        root._sub_forms_count += 1
+
+    def _check_sub_forms_paths(self, paths):
+        # Checks how many sub forms would be made for all the paths, before
+        # any of them is made.
+        root = self._get_root()
+        paths_made = set()
+        per_name = {}
+        made = 0
+        for parents in paths:
+            for depth in range(1, len(parents) + 1):
+                path = parents[:depth]
+                if path in paths_made:
+                    continue
+                paths_made.add(path)
+                name, index = path[-1]
+                limit = root.max_sub_form_index
+                if limit is not None and index > limit:
+                    raise LimitExceeded('max_sub_form_index', limit)
+                key = (path[:-1], name)
+                per_name[key] = per_name.get(key, 0) + 1
+                limit = root.max_sub_forms_per_name
+                if limit is not None and per_name[key] > limit:
+                    raise LimitExceeded('max_sub_forms_per_name', limit)
+                made += index != 0
+                limit = root.max_sub_forms
+                if limit is not None and made > limit:
+                    raise LimitExceeded('max_sub_forms', limit)
+
     def get_sub_form(self, name, index):
         return self.childs[name][index]
 
     def _clone_sub_form(self, name):
-        form = self.childs[name][0]
-        form = deepcopy(form)
-        form.reset()
+        try:
+            form = self._spare_sub_forms[name].pop()
+        except (KeyError, IndexError):
+            return self.childs[name][0]._clone_schema()
+        form.clear()
         return form
 
     def _validate_sub_forms(self):
+        executor = self._get_validation_executor()
+        if executor is not None:
+            return self._validate_sub_forms_in(executor)
         success = True
         for sub_forms in self.childs.values():
             for sub_form in sub_forms.values():
+                if self._is_error_budget_spent():
+                    return False
                 success &= sub_form._validate()
         return success
 
+    async def _validate_sub_forms_async(self):
+        if self._get_root().max_errors is not None:
+            success = True
+            for sub_forms in self.childs.values():
+                for sub_form in sub_forms.values():
+                    if self._is_error_budget_spent():
+                        return False
+                    success &= await sub_form._validate_async()
+            return success
+        results = await gather(*[
+            sub_form._validate_async()
+            for sub_forms in self.childs.values()
+            for sub_form in sub_forms.values()
+        ])
+        return all(results)
+
+    def _get_validation_executor(self):
+        # Only the root form uses the executor. Deeper sub forms are validated
+        # in the thread of their top sub form, so no thread waits for the
+        # pool it is running in.
+        if self.parent is None:
+            return self.validation_executor
+        return None
+
+    def _validate_sub_forms_in(self, executor):
+        futures = [
+            executor.submit(sub_form._validate)
+            for sub_forms in self.childs.values()
+            for sub_form in sub_forms.values()
+        ]
+        wait(futures)
+        success = True
+        for future in futures:
+            success &= future.result()
+        return success
+
     def _parsed_sub_form(self, name, data):
         #TODO: find some key error maybe?
         for index, values in enumerate(data):
@@ -78,45 +355,211 @@ class TreeForm(Form):
             sub_form.parse_dict(values)
         return True
 
+    def _is_known_name(self, name):
+        return super()._is_known_name(name) or name in self.childs
+
     def _validate(self):
         # Why this method was implemented in this way?
         # Goal was to run validation on fields and if it succeeded, then form
         # can run form validators.
         # But sub_forms should always run validation.
+        # With incremental_validation, forms which were validated before and
+        # did not change since then, only return the previous result.
+        self._set_dirty()
+        if self._is_validation_skipped():
+            return self.success
         super()._validate()
         self.success &= self._validate_sub_forms()
+        self._set_validated()
+        return self.success
+
+    def _set_validated(self):
+        # Result is kept for incremental validation, only if the form was
+        # validated fully (not stopped by the error budget).
+        if not self._is_error_budget_spent():
+            self._changed = False
+
+    async def _validate_async(self):
+        self._set_dirty()
+        if self._is_validation_skipped():
+            return self.success
+        await super()._validate_async()
+        self.success &= await self._validate_sub_forms_async()
+        self._set_validated()
         return self.success
 
+    def _is_validation_skipped(self):
+        if not self._get_root().incremental_validation:
+            return False
+        if self.success is not None:
+            if not self._changed:
+                return True
+            self._reset_errors()
+        return False
+
+    def _parse_raw_data(self, raw_data):
+        # All names are decoded first and grouped by the sub form, so every
+        # sub form is found only once, no matter how many fields it has.
+        self._check_raw_data(raw_data)
+        self.raw_data = raw_data
+        groups = {}
+        for name, values in raw_data.items():
+            if name == self.form_name_value:
+                continue
+            decoded = self._get_decoded_name(name)
+            groups.setdefault(decoded[1], []).append((name, decoded, values))
+        self._check_sub_forms_paths(groups)
+
+        forms = {(): self}
+        parsed = set()
+        for parents, items in groups.items():
+            try:
+                form = self._get_sub_form_from(parents, forms)
+            except KeyError:
+                raise WrongValueName(items[0][0])
+            for name, decoded, values in items:
+                field = self._get_form_field(form, name, decoded)
+                field.set_values(values)
+                parsed.add(id(field))
+        if self.incremental_validation:
+            # Form is not reset between validations, so sub forms and values
+            # missing in the new data must be removed here.
+            self._remove_missing((), set(forms), parsed)
+
+    def _remove_missing(self, path, paths, fields):
+        for field in self.fields.values():
+            if field.values and id(field) not in fields:
+                field.set_values([])
+        for name, sub_forms in self.childs.items():
+            for index, sub_form in list(sub_forms.items()):
+                sub_path = path + ((name, index),)
+                if index == 0 or sub_path in paths:
+                    sub_form._remove_missing(sub_path, paths, fields)
+                    continue
+                del sub_forms[index]
+                self._keep_spare_sub_forms(name, [sub_form])
+                self._get_root()._sub_forms_count -= 1
+                self._set_changed()
+
     def _get_field(self, name):
-        data = self._decode_name(name)
-        name = data['name']
+        decoded = self._get_decoded_name(name)
+        try:
+            form = self._get_sub_form(decoded[1])
+        except KeyError:
+            raise WrongValueName(name)
+        return self._get_form_field(form, name, decoded)
+
+    def _get_decoded_name(self, name):
+        decoded = self.name_cache.get((self.name_codec, name))
+        if decoded is None:
+            decoded = self._decode_name(name)
+        max_depth = self._get_root().max_depth
+        if max_depth is not None and len(decoded[1]) > max_depth:
+            raise LimitExceeded('max_depth', max_depth)
+        return decoded
 
-        form = self._get_sub_form(data['parents'][1:])
-        return form.fields[name]
+    def _get_form_field(self, form, name, decoded):
+        try:
+            field = form.fields[decoded[0]]
+        except KeyError:
+            raise WrongValueName(name)
+        # Only names which point to existing fields are cached, so malformed
+        # or made up names can not flood the cache.
+        self.name_cache.set((self.name_codec, name), decoded)
+        return field
 
-    def get_data_dict(self, minified=False):
+    def get_data_dict(self, minified=False, as_list=False):
+        """get_data_dict([minified, as_list])
+        Get all values from all fields and sub forms.
+
+        :param minified: if True: all list with length of 1 will be converted
+            to direct value. all empty list will be omited
+        :param as_list: if True: sub forms will be returned as list ordered by
+            index, instead of dict of index to sub form data
+        :rtype: dict
+        """
         tree = super().get_data_dict(minified=minified)
         for name, sub_forms in self.childs.items():
-            tree[name] = {}
-            for index, sub_form in sub_forms.items():
-                tree[name][index] = sub_form.get_data_dict(minified)
+            if as_list:
+                tree[name] = [
+                    sub_form.get_data_dict(minified, as_list)
+                    for sub_form in sub_forms.values()
+                ]
+            else:
+                tree[name] = {
+                    index: sub_form.get_data_dict(minified)
+                    for index, sub_form in sub_forms.items()
+                }
         return tree
 
+    def explain_validators(self):
+        """
+        Get validators of all fields in the order they are run, with stats.
+        Sub forms of one name share stats, so only the first one of every name
+        is explained.
+
+        :rtype: dict
+        """
+        explain = super().explain_validators()
+        explain['sub_forms'] = {
+            name: sub_forms[0].explain_validators()
+            for name, sub_forms in self.childs.items()
+        }
+        return explain
+
+    def _iter_data(self, path, minified):
+        yield from super()._iter_data(path, minified)
+        for name, sub_forms in self.childs.items():
+            for index, sub_form in sub_forms.items():
+                yield from sub_form._iter_data(
+                    path + ((name, index),), minified)
+
     def _decode_name(self, name):
+        """
+        Decode name made by ``TreeField.get_name``.
+
+        :returns: tuple of field name and tuple of ``(form name, index)``
+            pairs of sub forms
+        """
         try:
-            json = urlsafe_b64decode(name).decode('utf8')
-            return loads(json)
-        except (binascii.Error, UnicodeDecodeError):
-            raise WrongValueName(name)
+            field_name, parents = self.name_codec.decode(name)
+            if self._is_decoded_name_valid(field_name, parents):
+                return field_name, parents
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ):
+            pass
+        raise WrongValueName(name)
+
+    def _is_decoded_name_valid(self, field_name, parents):
+        if type(field_name) is not str:
+            return False
+        for form_name, index in parents:
+            if type(form_name) is not str or type(index) is not int:
+                return False
+        return True
 
     def _get_sub_form(self, parents):
-        if parents == []:
+        if not parents:
             return self
-        form_name = parents[0]['name']
-        index = parents[0]['index']
+        form_name, index = parents[0]
         sub_form = self.get_or_create_sub_form(form_name, index)
         return sub_form._get_sub_form(parents[1:])
 
+    def _get_sub_form_from(self, parents, forms):
+        try:
+            return forms[parents]
+        except KeyError:
+            pass
+        parent = self._get_sub_form_from(parents[:-1], forms)
+        form = parent.get_or_create_sub_form(*parents[-1])
+        forms[parents] = form
+        return form
+
     def get_report(self):
         reports = super().get_report()
         reports['childs'] = {}
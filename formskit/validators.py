@@ -2,9 +2,16 @@
 import re
 from decimal import Decimal, InvalidOperation
 
+from .asyncs import is_overridden, maybe_await, not_awaitable
+
 
 class FieldValidator(object):
     message = None
+    stop_on_error = False
+    pinned = False
+    validate_values = None
+    _rejected = False
+    _batch_classes = {}
 
     def __init__(self):
         if self.message is None:
@@ -14,23 +21,106 @@ class FieldValidator(object):
         self.field = field
 
     def make_field(self):
-        if self.validate_field() is False:
+        result = not_awaitable(self.validate_field(), self, 'validate_field')
+        if result is False:
             self.set_field_error()
 
     def make_value(self, field_value):
         self.field_value = field_value
         self.value = field_value.value
-        if self.validate_value() is False:
+        result = not_awaitable(self.validate_value(), self, 'validate_value')
+        if result is False:
             self.set_value_error()
 
+    def make_values(self, field_values):
+        """
+        Validate all the values. If ``validate_values`` is implemented, it is
+        called once for all values, instead of calling ``validate_value`` for
+        every one. When ``fail_fast`` of the field is set, no more errors are
+        set after the first one.
+        """
+        fail_fast = self.field.fail_fast
+        if not self._has_batch():
+            for field_value in field_values:
+                self.make_value(field_value)
+                if fail_fast and field_value.error:
+                    return
+            return
+        mask = self.validate_values(
+            [field_value.value for field_value in field_values])
+        for field_value, error in zip(field_values, mask):
+            if error:
+                self.field_value = field_value
+                self.value = field_value.value
+                self.set_value_error()
+                if fail_fast:
+                    return
+
+    async def make_field_async(self):
+        """
+        Same as ``make_field``, but ``validate_field`` can be a coroutine.
+        If ``make_field`` was overridden, it is used instead.
+        """
+        if is_overridden(self, FieldValidator, 'make_field'):
+            self.make_field()
+            return
+        if await maybe_await(self.validate_field()) is False:
+            self.set_field_error()
+
+    async def make_values_async(self, field_values):
+        """
+        Same as ``make_values``, but ``validate_value`` can be a coroutine.
+        Values are validated one after another, because the validator keeps
+        the current value. If ``make_values`` or ``make_value`` was
+        overridden, ``make_values`` is used instead.
+        """
+        if (
+            self._has_batch()
+            or is_overridden(self, FieldValidator, 'make_values')
+            or is_overridden(self, FieldValidator, 'make_value')
+        ):
+            self.make_values(field_values)
+            return
+        for field_value in field_values:
+            self.field_value = field_value
+            self.value = field_value.value
+            if await maybe_await(self.validate_value()) is False:
+                self.set_value_error()
+                if self.field.fail_fast:
+                    return
+
+    def _has_batch(self):
+        # validate_values can be used only if validate_value (or make_value,
+        # which calls it) was not overridden in a subclass of the class which
+        # implemented it.
+        cls = self.__class__
+        try:
+            return self._batch_classes[cls]
+        except KeyError:
+            pass
+        has_batch = False
+        for parent in cls.__mro__:
+            if 'validate_values' in parent.__dict__:
+                has_batch = parent.validate_values is not None
+                break
+            if (
+                'validate_value' in parent.__dict__
+                or 'make_value' in parent.__dict__
+            ):
+                break
+        self._batch_classes[cls] = has_batch
+        return has_batch
+
     @property
     def value_converted(self):
         return self.field.convert(self.value)
 
     def set_field_error(self):
+        self._rejected = True
         self.field.set_error(self.message)
 
     def set_value_error(self):
+        self._rejected = True
         self.field_value.set_error(self.message)
 
     def validate_field(self):
@@ -45,27 +135,163 @@ class NotEmpty(FieldValidator):
         return len(self.field.values) > 0
 
     def validate_value(self):
-        if self.value is None:
-            return False
-        elif type(self.value) == str and self.value.strip() == '':
-            return False
-        elif type(self.value) == bytes and self.value.strip() == b'':
-            return False
-        elif type(self.value) in [list, dict, tuple] and len(self.value) == 0:
-            return False
-        return True
+        return not self._is_empty(self.value)
 
+    def validate_values(self, values):
+        is_empty = self._is_empty
+        return [is_empty(value) for value in values]
 
-class IsDigit(FieldValidator):
+    @staticmethod
+    def _is_empty(value):
+        if value is None:
+            return True
+        elif type(value) == str and value.strip() == '':
+            return True
+        elif type(value) == bytes and value.strip() == b'':
+            return True
+        elif type(value) in [list, dict, tuple] and len(value) == 0:
+            return True
+        return False
 
-    """Will fail if value is not a digit."""
 
-    regex = re.compile('^-{0,1}[0-9]+$')
+class RegexValidator(FieldValidator):
+
+    """
+    Will fail if ``regex`` is not found in value. Values longer than
+    ``max_length`` fail without matching, so matching time is limited.
+    Patterns of all RegexValidators of one field are combined into one, so
+    every value is matched only once.
+    """
+
+    regex = None
+    max_length = 1000
+
+    def __init__(self, regex=None, max_length=None):
+        super().__init__()
+        if regex is not None:
+            self.regex = re.compile(regex)
+        if max_length is not None:
+            self.max_length = max_length
 
     def validate_value(self):
-        if not self.value:
+        return not self._is_rejected(self.value, self._get_search())
+
+    def validate_values(self, values):
+        search = self._get_search()
+        is_rejected = self._is_rejected
+        return [is_rejected(value, search) for value in values]
+
+    def _is_rejected(self, value, search):
+        if len(value) > self.max_length:
             return True
-        return re.search(self.regex, self.value) is not None
+        return search(value) is None
+
+    def _get_search(self):
+        engine = self.field._regex_engine
+        if engine is None:
+            engine = RegexEngine(self.field.validators)
+            self.field._regex_engine = engine
+        return engine.get_search(self)
+
+
+class RegexEngine(object):
+
+    """
+    One pattern made from patterns of many RegexValidators of a field, with
+    a named group for every validator, so value is matched only once for all
+    of them. Patterns which can not be combined (bytes, with flags other than
+    ignore case, multiline, dotall and ascii, with numbered backreferences)
+    are matched by their validators.
+    """
+
+    max_cached = 1024
+    _combined_flags = {
+        re.IGNORECASE: 'i',
+        re.MULTILINE: 'm',
+        re.DOTALL: 's',
+        re.ASCII: 'a',
+    }
+    _supported_flags = (
+        re.IGNORECASE | re.MULTILINE | re.DOTALL | re.ASCII | re.UNICODE)
+    _numbered_reference = re.compile(r'\\[1-9]|\(\?\(')
+
+    def __init__(self, validators):
+        self.regex = None
+        self._groups = {}
+        self._matches = {}
+        validators = [
+            validator for validator in validators
+            if isinstance(validator, RegexValidator)
+            and self._is_combinable(validator.regex)
+        ]
+        if len(validators) > 1:
+            self._combine(validators)
+
+    def _is_combinable(self, regex):
+        return (
+            regex is not None
+            and isinstance(regex.pattern, str)
+            and not regex.flags & ~self._supported_flags
+            and self._numbered_reference.search(regex.pattern) is None
+        )
+
+    def _combine(self, validators):
+        parts = []
+        groups = {}
+        for index, validator in enumerate(validators):
+            name = '_v%d' % (index,)
+            groups[validator] = name
+            parts.append('(?:(?=[\\s\\S]*?(?P<%s>%s))|)' % (
+                name, self._get_pattern(validator.regex)))
+        try:
+            self.regex = re.compile(''.join(parts))
+        except re.error:
+            return
+        self._groups = groups
+
+    def _get_pattern(self, regex):
+        flags = ''.join(
+            letter
+            for flag, letter in self._combined_flags.items()
+            if regex.flags & flag
+        )
+        return '(?%s:%s)' % (flags, regex.pattern)
+
+    def get_search(self, validator):
+        """
+        Get function, which searches the pattern of the validator in a value
+        and returns None if not found.
+        """
+        name = self._groups.get(validator)
+        if name is None:
+            return validator.regex.search
+
+        def search(value):
+            match = self._match(value)
+            return None if match.start(name) == -1 else match
+        return search
+
+    def _match(self, value):
+        try:
+            return self._matches[value]
+        except KeyError:
+            pass
+        if len(self._matches) >= self.max_cached:
+            self._matches.clear()
+        match = self._matches[value] = self.regex.match(value)
+        return match
+
+
+class IsDigit(RegexValidator):
+
+    """Will fail if value is not a digit."""
+
+    regex = re.compile('^-{0,1}[0-9]+$')
+
+    def _is_rejected(self, value, search):
+        if not value:
+            return False
+        return super()._is_rejected(value, search)
 
 
 class IsDecimal(FieldValidator):
@@ -79,18 +305,29 @@ class IsDecimal(FieldValidator):
         except InvalidOperation:
             return False
 
+    def validate_values(self, values):
+        mask = []
+        for value in values:
+            try:
+                Decimal(value)
+                mask.append(False)
+            except InvalidOperation:
+                mask.append(True)
+        return mask
+
 
-class IsEmail(FieldValidator):
+class IsEmail(RegexValidator):
 
     """Will fail if value is not an email."""
 
     regex = re.compile(
         "^.+\\@(\\[?)[a-zA-Z0-9\\-\\.]+\\.([a-zA-Z]{2,3}|[0-9]{1,3})(\\]?)$")
+    max_length = 254
 
-    def validate_value(self):
-        if len(self.value) > 7:
-            return re.match(self.regex, self.value) is not None
-        return False
+    def _is_rejected(self, value, search):
+        if len(value) <= 7:
+            return True
+        return super()._is_rejected(value, search)
 
 
 class IsValueInAvalibleValues(FieldValidator):
@@ -102,12 +339,24 @@ class IsValueInAvalibleValues(FieldValidator):
         self.allow_empty = allow_empty
 
     def validate_value(self):
+        if self._is_allowed_empty(self.value):
+            return True
+
+        return self.value_converted in self.field.get_avalible_index()
+
+    def validate_values(self, values):
+        convert = self.field.convert
+        avalible = self.field.get_avalible_index()
+        return [
+            not self._is_allowed_empty(value)
+            and convert(value) not in avalible
+            for value in values
+        ]
+
+    def _is_allowed_empty(self, value):
         if self.allow_empty:
-            if self.value is None:
+            if value is None:
                 return True
-            elif type(self.value) == str and self.value.strip() == '':
+            elif type(value) == str and value.strip() == '':
                 return True
-
-        return self.value_converted in [
-            avalible.value for avalible in self.field.avalible_values
-        ]
+        return False